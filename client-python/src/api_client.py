@@ -3,14 +3,26 @@
 Handles device flow authentication and score polling.
 """
 
+import asyncio
+import functools
+import operator
+import threading
 import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
-from datetime import datetime
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta, timezone
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class DeviceAuthResponse:
     """Response from device authorization request."""
     device_code: str
@@ -22,7 +34,7 @@ class DeviceAuthResponse:
     interval: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TokenResponse:
     """Response from token request."""
     access_token: str
@@ -31,7 +43,7 @@ class TokenResponse:
     refresh_token: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PatrolScore:
     """Represents a patrol and its score."""
     id: str
@@ -39,7 +51,7 @@ class PatrolScore:
     score: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PatrolScoresResponse:
     """Response from get_patrol_scores API."""
     patrols: List[PatrolScore]
@@ -47,13 +59,9 @@ class PatrolScoresResponse:
     cached_at: datetime
     cache_expires_at: datetime
     rate_limit_state: str  # "NONE", "DEGRADED", "USER_TEMPORARY_BLOCK", "SERVICE_BLOCKED"
-    patrol_colors: Dict[str, str] = None  # Maps patrol ID to color name (e.g., "red", "blue")
+    patrol_colors: Dict[str, str] = field(default_factory=dict)  # Maps patrol ID to color name (e.g., "red", "blue")
     websocket_requested: bool = False  # True when server supports the /ws/device endpoint
 
-    def __post_init__(self):
-        if self.patrol_colors is None:
-            self.patrol_colors = {}
-
 
 class DeviceFlowError(Exception):
     """Base exception for device flow errors."""
@@ -65,6 +73,13 @@ class AuthorizationPending(DeviceFlowError):
     pass
 
 
+class SlowDown(DeviceFlowError):
+    """Polling too fast; the poll interval must be increased."""
+    def __init__(self, message: str, retry_after: Optional[int] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
 class AccessDenied(DeviceFlowError):
     """User denied the authorization."""
     pass
@@ -75,6 +90,11 @@ class ExpiredToken(DeviceFlowError):
     pass
 
 
+class NotAuthenticated(DeviceFlowError):
+    """No valid access token; the device flow must be run again."""
+    pass
+
+
 class SectionNotFound(DeviceFlowError):
     """Section not found in user's profile."""
     pass
@@ -98,6 +118,128 @@ class ServiceBlocked(DeviceFlowError):
     pass
 
 
+# Added to the server's poll interval so polls never arrive early
+POLL_INTERVAL_MARGIN = 0.25
+
+
+def _poll_schedule(auth: DeviceAuthResponse):
+    """Generate the waits between token polls for a device code.
+
+    Yields the delay before the next poll; the caller sends back the
+    AuthorizationPending or SlowDown that poll raised. Raises ExpiredToken
+    rather than yield a wait that would land after the code expires. Shared
+    by the sync and async device flows so they keep the same timing.
+    """
+    # The small margin keeps latency jitter from making a poll arrive early
+    # and earn a slow_down (RFC 8628 3.5).
+    deadline = time.monotonic() + auth.expires_in
+    poll_interval = auth.interval + POLL_INTERVAL_MARGIN
+    delay = poll_interval
+
+    while True:
+        # Don't sleep through to a poll that would land after expiry
+        if time.monotonic() + delay > deadline:
+            raise ExpiredToken("Device code expired before authorization")
+
+        pending = yield delay
+
+        if isinstance(pending, SlowDown):
+            # RFC 8628 asks for a longer interval; back off by doubling
+            poll_interval *= 2
+            delay = max(poll_interval, pending.retry_after or 0)
+        else:
+            delay = poll_interval
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_iso(value: str) -> datetime:
+    """Parse an RFC 3339 timestamp from the API.
+
+    Python 3.11+ accepts a trailing 'Z' directly; older versions need it
+    rewritten as an offset. Cached because cache timestamps repeat across
+    polls until the server refreshes its cache.
+    """
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+# Pulls the PatrolScore constructor arguments out of a patrol JSON object
+_patrol_fields = operator.itemgetter("id", "name", "score")
+
+
+def _decode_json(response: requests.Response):
+    """Decode a JSON response body, using orjson when it is installed."""
+    if not ORJSON_AVAILABLE:
+        return response.json()
+    try:
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError as e:
+        raise DeviceFlowError(f"Invalid JSON in response: {e}")
+
+
+def _parse_max_age(response: requests.Response) -> Optional[int]:
+    """Return Cache-Control max-age in seconds, or None if not present."""
+    for directive in response.headers.get("Cache-Control", "").split(","):
+        name, _, value = directive.strip().partition("=")
+        if name.lower() == "max-age":
+            try:
+                return max(0, int(value))
+            except ValueError:
+                return None
+    return None
+
+
+def _parse_retry_after(response: requests.Response) -> Optional[int]:
+    """Return the Retry-After header in seconds, or None if absent or not numeric."""
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0, int(value))
+    except ValueError:
+        return None
+
+
+class _AuthFlight:
+    """One in-progress device flow: waiters block on done, then read result."""
+    __slots__ = ("done", "result")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Optional[TokenResponse] = None
+
+
+# Pooled transport adapters shared by every client talking to the same base URL
+_ADAPTERS: Dict[str, HTTPAdapter] = {}
+_ADAPTERS_LOCK = threading.Lock()
+
+
+def _shared_adapter(base_url: str) -> HTTPAdapter:
+    """Return the pooled HTTPAdapter for base_url, creating it on first use."""
+    with _ADAPTERS_LOCK:
+        adapter = _ADAPTERS.get(base_url)
+        if adapter is None:
+            # Retry transient gateway failures at the transport level. 429 and 503
+            # are deliberately excluded: the API uses them for rate limiting and
+            # service blocking, which get_patrol_scores() reports to the caller.
+            # Honouring Retry-After would make urllib3 retry those anyway, so it
+            # is off. Only GETs are retried: re-sending a POST to /device/authorize
+            # after a read error would mint a second device code.
+            retry = Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[502, 504],
+                allowed_methods=["GET"],
+                respect_retry_after_header=False,
+                raise_on_status=False,
+            )
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry)
+            _ADAPTERS[base_url] = adapter
+        return adapter
+
+
 class OSMDeviceClient:
     """Client for OSM Device Adapter API."""
 
@@ -110,11 +252,43 @@ class OSMDeviceClient:
             timeout: Request timeout in seconds
         """
         self.base_url = base_url.rstrip('/')
+        self._url_device_authorize = f"{self.base_url}/device/authorize"
+        self._url_device_token = f"{self.base_url}/device/token"
+        self._url_patrols = f"{self.base_url}/api/v1/patrols"
         self.client_id = client_id
         self.timeout = timeout
         self.session = requests.Session()
         self.access_token: Optional[str] = None
 
+        # Set from a 429 response; no requests are sent until the block lifts
+        self._blocked_until: Optional[datetime] = None
+        self._blocked_until_monotonic = 0.0
+
+        # Last patrol scores, reused until the server's cache_expires_at passes
+        self._last_response: Optional[PatrolScoresResponse] = None
+        self._cache_expiry_monotonic = 0.0
+        self._last_etag: Optional[str] = None
+
+        # Single-flight authentication: concurrent authenticate() calls wait
+        # on the in-progress device flow instead of starting their own.
+        self._auth_lock = threading.Lock()
+        self._auth_flight: Optional[_AuthFlight] = None
+
+        # Connection pools are shared between clients for the same server;
+        # the session (and its Authorization header) stays per client.
+        adapter = _shared_adapter(self.base_url)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({"Accept": "application/json"})
+
+    @classmethod
+    def close_all(cls):
+        """Close every shared connection pool. Call once at shutdown."""
+        with _ADAPTERS_LOCK:
+            for adapter in _ADAPTERS.values():
+                adapter.close()
+            _ADAPTERS.clear()
+
     def request_device_code(self, scope: str = "section:member:read") -> DeviceAuthResponse:
         """Request a device code to start the authorization flow.
 
@@ -127,16 +301,15 @@ class OSMDeviceClient:
         Raises:
             DeviceFlowError: If request fails
         """
-        url = f"{self.base_url}/device/authorize"
         payload = {
             "client_id": self.client_id,
             "scope": scope
         }
 
         try:
-            response = self.session.post(url, json=payload, timeout=self.timeout)
+            response = self.session.post(self._url_device_authorize, json=payload, timeout=self.timeout)
             response.raise_for_status()
-            data = response.json()
+            data = _decode_json(response)
 
             return DeviceAuthResponse(
                 device_code=data["device_code"],
@@ -161,27 +334,45 @@ class OSMDeviceClient:
 
         Raises:
             AuthorizationPending: User hasn't authorized yet
+            SlowDown: Polling too fast (retry_after set if the server sent Retry-After)
             AccessDenied: User denied authorization
             ExpiredToken: Device code expired
             DeviceFlowError: Other errors
         """
-        url = f"{self.base_url}/device/token"
-        payload = {
+        return self._poll_once(self._token_payload(device_code))
+
+    def _token_payload(self, device_code: str) -> dict:
+        """Build the token request body; constant for one device code."""
+        return {
             "grant_type": "urn:ietf:params:oauth:grant-type:device_code",
             "device_code": device_code,
             "client_id": self.client_id
         }
 
+    def _poll_once(self, payload: dict) -> TokenResponse:
+        """Send one token request with a prebuilt payload (see poll_for_token)."""
         try:
-            response = self.session.post(url, json=payload, timeout=self.timeout)
+            response = self.session.post(self._url_device_token, json=payload, timeout=self.timeout)
+            retry_after = _parse_retry_after(response)
+
+            # Token endpoint rate limit - treat as a request to poll more slowly
+            if response.status_code == 429:
+                raise SlowDown("Token polling rate limited", retry_after)
 
             # Check for pending authorization
             if response.status_code == 400:
-                error_data = response.json()
+                # By far the most common reply while the user is authorizing;
+                # recognise it without decoding the body.
+                if b'"authorization_pending"' in response.content:
+                    raise AuthorizationPending("Authorization pending")
+
+                error_data = _decode_json(response)
                 error = error_data.get("error", "")
 
                 if error == "authorization_pending":
                     raise AuthorizationPending("Authorization pending")
+                elif error == "slow_down":
+                    raise SlowDown("Polling too fast", retry_after)
                 elif error == "access_denied":
                     raise AccessDenied("User denied authorization")
                 elif error == "expired_token":
@@ -190,7 +381,7 @@ class OSMDeviceClient:
                     raise DeviceFlowError(f"Token error: {error}")
 
             response.raise_for_status()
-            data = response.json()
+            data = _decode_json(response)
 
             return TokenResponse(
                 access_token=data["access_token"],
@@ -207,6 +398,12 @@ class OSMDeviceClient:
     def get_patrol_scores(self) -> PatrolScoresResponse:
         """Get current patrol scores.
 
+        While the previous response's cache_expires_at has not passed, that
+        response is returned (marked from_cache) without a request. Call
+        invalidate_cache() when the server signals that scores changed.
+        If the server sent an ETag, later requests revalidate with
+        If-None-Match and a 304 reuses the previous response.
+
         Returns:
             PatrolScoresResponse with patrols, cache info, and rate limit state
 
@@ -218,66 +415,41 @@ class OSMDeviceClient:
             DeviceFlowError: Other request failures or not authenticated
         """
         if not self.access_token:
-            raise DeviceFlowError("Not authenticated. Call authenticate() first.")
+            raise NotAuthenticated("Not authenticated. Call authenticate() first.")
 
-        url = f"{self.base_url}/api/v1/patrols"
-        headers = {
-            "Authorization": f"Bearer {self.access_token}"
-        }
+        # Still inside a rate-limit block - answer locally without a request
+        remaining = self._blocked_until_monotonic - time.monotonic()
+        if remaining > 0:
+            raise UserTemporaryBlock("User temporarily blocked", self._blocked_until, int(remaining) + 1)
 
-        try:
-            response = self.session.get(url, headers=headers, timeout=self.timeout)
+        if self._last_response is not None and time.monotonic() < self._cache_expiry_monotonic:
+            return replace(self._last_response, from_cache=True)
 
-            # Handle specific error status codes
-            if response.status_code == 400:
-                error_data = response.json()
-                error_code = error_data.get("error", "")
-                if error_code == "section_not_found":
-                    raise SectionNotFound(error_data.get("message", "Section not found"))
-                response.raise_for_status()
+        headers = None
+        if self._last_etag and self._last_response is not None:
+            headers = {"If-None-Match": self._last_etag}
 
-            elif response.status_code == 401:
-                raise DeviceFlowError("Authentication expired or invalid")
+        try:
+            response = self.session.get(self._url_patrols, headers=headers, timeout=self.timeout)
 
-            elif response.status_code == 409:
-                error_data = response.json()
-                error_code = error_data.get("error", "")
-                if error_code == "not_in_term":
-                    raise NotInTerm(error_data.get("message", "Not in active term"))
-                response.raise_for_status()
+            if response.status_code == 304 and self._last_response is not None:
+                return self._revalidated(response)
 
-            elif response.status_code == 429:
-                error_data = response.json()
-                blocked_until_str = error_data.get("blocked_until", "")
-                retry_after = error_data.get("retry_after", 1800)
-                blocked_until = datetime.fromisoformat(blocked_until_str.replace('Z', '+00:00'))
-                raise UserTemporaryBlock(
-                    error_data.get("message", "User temporarily blocked"),
-                    blocked_until,
-                    retry_after
-                )
-
-            elif response.status_code == 503:
-                error_data = response.json()
-                raise ServiceBlocked(error_data.get("message", "Service blocked"))
-
-            # Raise for any other HTTP errors
-            response.raise_for_status()
+            # Error statuses are mapped to exceptions by their handler
+            if response.status_code != 200:
+                handler = self._PATROL_ERROR_HANDLERS.get(response.status_code)
+                if handler is not None:
+                    handler(self, response)
+                # Raise for any other HTTP errors
+                response.raise_for_status()
 
             # Parse successful response
-            data = response.json()
+            data = _decode_json(response)
 
-            patrols = [
-                PatrolScore(
-                    id=p["id"],
-                    name=p["name"],
-                    score=p["score"]
-                )
-                for p in data["patrols"]
-            ]
+            patrols = [PatrolScore(*_patrol_fields(p)) for p in data["patrols"]]
 
-            cached_at = datetime.fromisoformat(data["cached_at"].replace('Z', '+00:00'))
-            cache_expires_at = datetime.fromisoformat(data["cache_expires_at"].replace('Z', '+00:00'))
+            cached_at = _parse_iso(data["cached_at"])
+            cache_expires_at = _parse_iso(data["cache_expires_at"])
 
             # Extract patrol colors from settings if present
             patrol_colors = data.get("settings", {}).get("patrolColors", {}) if data.get("settings") else {}
@@ -286,7 +458,7 @@ class OSMDeviceClient:
             ws_info = data.get("websocket") or {}
             websocket_requested = bool(ws_info.get("requested", False))
 
-            return PatrolScoresResponse(
+            result = PatrolScoresResponse(
                 patrols=patrols,
                 from_cache=data.get("from_cache", False),
                 cached_at=cached_at,
@@ -296,11 +468,81 @@ class OSMDeviceClient:
                 websocket_requested=websocket_requested,
             )
 
+            # Convert the wall-clock expiry to monotonic so clock steps can't extend it
+            ttl = (cache_expires_at - datetime.now(timezone.utc)).total_seconds()
+            self._last_response = result
+            self._cache_expiry_monotonic = time.monotonic() + ttl
+            self._last_etag = response.headers.get("ETag")
+            return result
+
         except requests.exceptions.RequestException as e:
             if not isinstance(e, DeviceFlowError):
                 raise DeviceFlowError(f"Failed to get patrol scores: {e}")
             raise
 
+    def _revalidated(self, response: requests.Response) -> PatrolScoresResponse:
+        """Reuse the previous response after a 304 Not Modified.
+
+        A 304 carries no body, so the new expiry comes from Cache-Control
+        max-age when present, otherwise the previous response's cache lifetime.
+        """
+        last = self._last_response
+        ttl = _parse_max_age(response)
+        if ttl is None:
+            ttl = (last.cache_expires_at - last.cached_at).total_seconds()
+        now = datetime.now(timezone.utc)
+        result = replace(last, from_cache=True, cached_at=now, cache_expires_at=now + timedelta(seconds=ttl))
+        self._last_response = result
+        self._cache_expiry_monotonic = time.monotonic() + ttl
+        self._last_etag = response.headers.get("ETag", self._last_etag)
+        return result
+
+    def _handle_bad_request(self, response: requests.Response):
+        error_data = _decode_json(response)
+        if error_data.get("error", "") == "section_not_found":
+            raise SectionNotFound(error_data.get("message", "Section not found"))
+        response.raise_for_status()
+
+    def _handle_unauthorized(self, response: requests.Response):
+        self.clear_access_token()
+        raise NotAuthenticated("Authentication expired or invalid")
+
+    def _handle_conflict(self, response: requests.Response):
+        error_data = _decode_json(response)
+        if error_data.get("error", "") == "not_in_term":
+            raise NotInTerm(error_data.get("message", "Not in active term"))
+        response.raise_for_status()
+
+    def _handle_rate_limited(self, response: requests.Response):
+        # With a Retry-After header the body is optional; only the message is used
+        try:
+            error_data = _decode_json(response)
+        except (ValueError, DeviceFlowError):
+            error_data = {}
+        # Prefer the Retry-After header over the body's timing fields
+        retry_after = _parse_retry_after(response)
+        if retry_after is not None:
+            blocked_until = datetime.now(timezone.utc) + timedelta(seconds=retry_after)
+        else:
+            retry_after = error_data.get("retry_after", 1800)
+            blocked_until = _parse_iso(error_data.get("blocked_until", ""))
+        self._blocked_until = blocked_until
+        self._blocked_until_monotonic = time.monotonic() + retry_after
+        raise UserTemporaryBlock(error_data.get("message", "User temporarily blocked"), blocked_until, retry_after)
+
+    def _handle_service_blocked(self, response: requests.Response):
+        error_data = _decode_json(response)
+        raise ServiceBlocked(error_data.get("message", "Service blocked"))
+
+    # get_patrol_scores() error handlers by HTTP status
+    _PATROL_ERROR_HANDLERS = {
+        400: _handle_bad_request,
+        401: _handle_unauthorized,
+        409: _handle_conflict,
+        429: _handle_rate_limited,
+        503: _handle_service_blocked,
+    }
+
     def authenticate(self, on_code_received=None, on_waiting=None) -> TokenResponse:
         """Perform full device flow authentication.
 
@@ -311,9 +553,37 @@ class OSMDeviceClient:
         Returns:
             TokenResponse with access_token
 
+        Only one device flow runs at a time. Callers arriving while a flow is
+        in progress wait for it and receive the same token; their callbacks
+        are not invoked.
+
         Raises:
             DeviceFlowError: If authentication fails
         """
+        with self._auth_lock:
+            flight = self._auth_flight
+            leader = flight is None
+            if leader:
+                flight = self._auth_flight = _AuthFlight()
+
+        # Waiters read the result from their own flight, so a new flight
+        # started once this one finishes can't overwrite it under them
+        if not leader:
+            flight.done.wait()
+            if flight.result is None:
+                raise DeviceFlowError("Concurrent authentication failed")
+            return flight.result
+
+        try:
+            flight.result = self._run_device_flow(on_code_received, on_waiting)
+            return flight.result
+        finally:
+            with self._auth_lock:
+                self._auth_flight = None
+            flight.done.set()
+
+    def _run_device_flow(self, on_code_received, on_waiting) -> TokenResponse:
+        """Request a device code and poll until the user authorizes it."""
         # Step 1: Request device code
         auth = self.request_device_code()
 
@@ -322,32 +592,68 @@ class OSMDeviceClient:
             on_code_received(auth.user_code, auth.verification_uri, auth.verification_uri_complete, auth.verification_uri_short)
 
         # Step 2: Poll for token
-        start_time = time.time()
-        poll_interval = auth.interval
+        payload = self._token_payload(auth.device_code)
+        schedule = _poll_schedule(auth)
+        delay = next(schedule)
 
         while True:
-            elapsed = time.time() - start_time
-            if elapsed > auth.expires_in:
-                raise ExpiredToken("Device code expired before authorization")
-
             # Wait before polling
-            time.sleep(poll_interval)
+            time.sleep(delay)
 
             if on_waiting:
                 on_waiting()
 
             try:
-                token = self.poll_for_token(auth.device_code)
-                self.access_token = token.access_token
+                token = self._poll_once(payload)
+                self.set_access_token(token.access_token)
                 return token
+            except (AuthorizationPending, SlowDown) as e:
+                # Keep waiting; AccessDenied and ExpiredToken propagate
+                delay = schedule.send(e)
+
+    async def authenticate_async(self, on_code_received=None, on_waiting=None) -> TokenResponse:
+        """Perform device flow authentication without blocking the event loop.
+
+        Same flow and callbacks as authenticate(), but waits between polls with
+        asyncio.sleep and runs each HTTP request in a worker thread, so a
+        pending authorization holds no thread while it waits for the user.
+        Not coalesced with concurrent authenticate() calls.
+
+        Returns:
+            TokenResponse with access_token
 
-            except AuthorizationPending:
-                # Keep waiting
-                continue
-            except AccessDenied:
-                raise
-            except ExpiredToken:
-                raise
+        Raises:
+            DeviceFlowError: If authentication fails
+        """
+        auth = await asyncio.to_thread(self.request_device_code)
+
+        if on_code_received:
+            on_code_received(auth.user_code, auth.verification_uri, auth.verification_uri_complete, auth.verification_uri_short)
+
+        payload = self._token_payload(auth.device_code)
+        schedule = _poll_schedule(auth)
+        delay = next(schedule)
+
+        while True:
+            await asyncio.sleep(delay)
+
+            if on_waiting:
+                on_waiting()
+
+            try:
+                token = await asyncio.to_thread(self._poll_once, payload)
+                self.set_access_token(token.access_token)
+                return token
+            except (AuthorizationPending, SlowDown) as e:
+                delay = schedule.send(e)
+
+    def invalidate_cache(self):
+        """Expire the cached patrol scores so the next call hits the server.
+
+        The last response and its ETag are kept so the request can still be
+        answered with 304 Not Modified if nothing changed.
+        """
+        self._cache_expiry_monotonic = 0.0
 
     def is_authenticated(self) -> bool:
         """Check if client has an access token.
@@ -364,3 +670,13 @@ class OSMDeviceClient:
             token: Access token string
         """
         self.access_token = token
+        self.session.headers["Authorization"] = f"Bearer {token}"
+
+    def clear_access_token(self):
+        """Forget the access token and stop sending it with requests."""
+        self.access_token = None
+        self.session.headers.pop("Authorization", None)
+        # Cached scores belong to the old token's section
+        self._last_response = None
+        self._cache_expiry_monotonic = 0.0
+        self._last_etag = None
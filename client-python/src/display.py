@@ -6,19 +6,24 @@ which gives crisp pixel-perfect output on LED matrices where the gaps between
 pixels make anti-aliased intermediate brightness look muddy.
 """
 
+import functools
+import hashlib
+import logging
 import os
 import tempfile
+import threading
 import time
-import math
-from typing import Dict, List, Tuple, Optional
-from PIL import Image, ImageDraw, ImageFont, BdfFontFile
+from typing import Callable, Dict, List, Tuple, Optional
+from PIL import Image, ImageChops, ImageDraw, ImageFont, BdfFontFile
+
+logger = logging.getLogger(__name__)
 
 try:
     from rgbmatrix import RGBMatrix, RGBMatrixOptions
     MATRIX_AVAILABLE = True
 except ImportError:
     MATRIX_AVAILABLE = False
-    print("WARNING: rgbmatrix library not available. Running in simulation mode.")
+    logger.warning("rgbmatrix library not available. Running in simulation mode.")
 
 try:
     import qrcode
@@ -26,7 +31,7 @@ try:
 except ImportError:
     QR_AVAILABLE = False
     if MATRIX_AVAILABLE:  # Only warn if we have the matrix but not QR
-        print("WARNING: qrcode library not available. QR codes will not be displayed.")
+        logger.warning("qrcode library not available. QR codes will not be displayed.")
 
 
 # Score color is consistent across all themes (reserved for future rising/falling indicators)
@@ -47,9 +52,21 @@ THEME_PALETTES = {
 # Bar brightness scale factor (0.0-1.0). Keeps bars dimmer than text for readability.
 BAR_BRIGHTNESS = 0.40
 
+# Bar colors with BAR_BRIGHTNESS already applied, keyed by theme color name
+BAR_RGB_SCALED = {
+    name: tuple(int(c * BAR_BRIGHTNESS) for c in palette["bar"])
+    for name, palette in THEME_PALETTES.items()
+}
+
 # Border brightness scale factor (0.0-1.0). Brighter than bars for a visible frame.
 BORDER_BRIGHTNESS = 0.60
 
+# Bar border colors (bar color at BORDER_BRIGHTNESS), keyed by theme color name
+BORDER_RGB_SCALED = {
+    name: tuple(int(c * BORDER_BRIGHTNESS) for c in palette["bar"])
+    for name, palette in THEME_PALETTES.items()
+}
+
 # Composite text colors: white at different intensities depending on whether
 # the text pixel overlaps a lit bar pixel or a dark background pixel.
 TEXT_ON_BAR = (255, 255, 255)   # 100% white over lit bar pixels
@@ -60,9 +77,44 @@ BAR_HEIGHT = 5   # rows
 BAR_WIDTH = 48   # columns (max LEDs = BAR_WIDTH * BAR_HEIGHT = 240)
 BAR_MAX_LEDS = BAR_WIDTH * BAR_HEIGHT  # 240
 
+# Each patrol occupies an 8-row strip; up to 4 strips fill the 32-row panel
+STRIP_HEIGHT = 8
+MAX_STRIPS = 4
+
+# Fixed per-strip row coordinates, precomputed once:
+# (border_top_y, bar_y, border_bottom_y, text_y)
+#   border_top_y    - top border line
+#   bar_y           - bar occupies rows 2-6 within the strip (5 rows)
+#   border_bottom_y - bottom border line
+#   text_y          - baseline for text (1px below bottom border)
+STRIP_ROWS = tuple(
+    (strip_y + 1, strip_y + 2, strip_y + 7, strip_y + 8)
+    for strip_y in range(0, STRIP_HEIGHT * MAX_STRIPS, STRIP_HEIGHT)
+)
+
 # Default bar color when patrol has no configured color
 DEFAULT_BAR_COLOR = "green"
 
+# Maximum number of fully rendered static screens kept for reuse
+SCREEN_CACHE_SIZE = 16
+
+# Maximum number of rasterised strings kept for reuse
+TEXT_CACHE_SIZE = 256
+
+# Maximum number of laid-out patrol strip labels kept for reuse
+STRIP_TEXT_CACHE_SIZE = 64
+
+# Status indicator colors by rate limit state
+STATUS_COLORS = {
+    "LOADING": (128, 128, 128),           # Grey
+    "NONE": (0, 255, 0),                  # Green (polling only)
+    "DEGRADED": (255, 191, 0),            # Amber
+    "USER_TEMPORARY_BLOCK": (255, 0, 0),  # Red
+    "SERVICE_BLOCKED": (255, 0, 0),       # Red (but will show message)
+}
+STATUS_DEFAULT_COLOR = (128, 128, 128)  # Grey, for unknown states
+STATUS_WS_COLOR = (0, 0, 255)           # Blue, NONE with WebSocket connected
+
 # BDF font search paths (pixel-perfect bitmap fonts for LED matrices)
 BDF_FONT_DIRS = [
     "/usr/local/share/fonts/",  # Common install location
@@ -87,23 +139,50 @@ NORMAL_FONT = "7x13.bdf"
 LARGE_FONT_SIZE = 18
 LARGE_FONT = "9x18B.bdf"
 
+# Converted BDF fonts (PIL .pil/.pbm) are kept here between runs
+FONT_CACHE_DIR = os.path.join(os.getenv("XDG_CACHE_HOME", os.path.expanduser("~/.cache")),
+                              "osm-scoreboard", "fonts")
+
 def _load_bdf_font(bdf_path: str) -> Optional[ImageFont.ImageFont]:
     """Convert a BDF font to PIL format and load it.
 
     PIL can't load BDF directly but has a converter. We convert to PIL's
-    bitmap font format (.pil/.pbm) in a temp directory and load from there.
+    bitmap font format (.pil/.pbm) and keep the result in FONT_CACHE_DIR,
+    keyed on the BDF file's path, size and mtime, so later starts load it
+    directly. If the cache can't be written the font is converted in a temp
+    directory for this run only.
     """
     try:
+        st = os.stat(bdf_path)
+        key = f"{os.path.abspath(bdf_path)}:{st.st_size}:{st.st_mtime_ns}"
+        cached = os.path.join(FONT_CACHE_DIR, hashlib.sha1(key.encode()).hexdigest()[:16])
+        try:
+            font = ImageFont.load(cached + ".pil")
+            logger.info("Loaded BDF font: %s (cached)", bdf_path)
+            return font
+        except (OSError, SyntaxError):
+            pass  # Not converted yet, or unreadable: convert again
+
         with open(bdf_path, "rb") as f:
             bdf = BdfFontFile.BdfFontFile(f)
+        try:
+            os.makedirs(FONT_CACHE_DIR, exist_ok=True)
+            tmpdir = tempfile.mkdtemp(prefix="pilfonts_", dir=FONT_CACHE_DIR)
+        except OSError:
             tmpdir = tempfile.mkdtemp(prefix="pilfonts_")
-            pil_path = os.path.join(tmpdir, "font")
-            bdf.save(pil_path)
-            font = ImageFont.load(pil_path + ".pil")
-            print(f"[DISPLAY] Loaded BDF font: {bdf_path}")
-            return font
+            cached = None
+        pil_path = os.path.join(tmpdir, "font")
+        bdf.save(pil_path)
+        font = ImageFont.load(pil_path + ".pil")
+        if cached:
+            # Glyph data first, so a cached .pil always has its .pbm
+            os.replace(pil_path + ".pbm", cached + ".pbm")
+            os.replace(pil_path + ".pil", cached + ".pil")
+            os.rmdir(tmpdir)
+        logger.info("Loaded BDF font: %s", bdf_path)
+        return font
     except Exception as e:
-        print(f"[DISPLAY] Failed to load BDF font {bdf_path}: {e}")
+        logger.warning("Failed to load BDF font %s: %s", bdf_path, e)
         return None
 
 
@@ -114,35 +193,130 @@ def _load_truetype_font(size: int) -> ImageFont.FreeTypeFont:
             return ImageFont.truetype(path, size)
         except (OSError, IOError):
             continue
-    print(f"WARNING: No TrueType font found at size {size}, using PIL default bitmap font")
+    logger.warning("No TrueType font found at size %d, using PIL default bitmap font", size)
     return ImageFont.load_default()
 
 
-def _load_fonts() -> Tuple[ImageFont.ImageFont, ImageFont.ImageFont, ImageFont.ImageFont]:
+def _load_fonts() -> Tuple[ImageFont.ImageFont, ImageFont.ImageFont,
+                           Callable[[], ImageFont.ImageFont]]:
     """Load fonts, preferring BDF bitmap fonts over TrueType.
 
+    The large font is only used by the countdown timer, so it is not loaded
+    here; a loader for it is returned instead.
+
     Returns:
-        (normal_font, small_font, large_font) tuple
+        (normal_font, small_font, load_large_font) tuple
     """
     # Try BDF fonts first (pixel-perfect for LED matrices)
     for base_path in BDF_FONT_DIRS:
-        normal_path = os.path.join(base_path, NORMAL_FONT)
-        small_path = os.path.join(base_path, SMALL_FONT)
-        large_path = os.path.join(base_path, LARGE_FONT)
-        if os.path.exists(normal_path) and os.path.exists(small_path) and os.path.exists(large_path):
+        # One directory listing instead of a stat per font file
+        try:
+            entries = set(os.listdir(base_path))
+        except OSError:
+            continue
+        if {NORMAL_FONT, SMALL_FONT, LARGE_FONT} <= entries:
+            normal_path = os.path.join(base_path, NORMAL_FONT)
+            small_path = os.path.join(base_path, SMALL_FONT)
+            large_path = os.path.join(base_path, LARGE_FONT)
             normal = _load_bdf_font(normal_path)
             small = _load_bdf_font(small_path)
-            large = _load_bdf_font(large_path)
-            if normal and small and large:
-                return normal, small, large
+            if normal and small:
+                return normal, small, lambda: _load_bdf_font(large_path) or _load_truetype_font(LARGE_FONT_SIZE)
 
     # Fall back to TrueType with 1-bit rendering
-    print("[DISPLAY] BDF fonts not found, falling back to TrueType (1-bit mode)")
-    return _load_truetype_font(NORMAL_FONT_SIZE), _load_truetype_font(SMALL_FONT_SIZE), _load_truetype_font(LARGE_FONT_SIZE)
+    logger.info("BDF fonts not found, falling back to TrueType (1-bit mode)")
+    return (_load_truetype_font(NORMAL_FONT_SIZE), _load_truetype_font(SMALL_FONT_SIZE),
+            functools.partial(_load_truetype_font, LARGE_FONT_SIZE))
+
+
+@functools.lru_cache(maxsize=4)
+def _zigzag_mask(height: int) -> Image.Image:
+    """1-bit column mask with pixels ON at even rows (0, 2, 4, ...)."""
+    mask = Image.new('1', (1, height), 0)
+    mask.putdata([1 if row % 2 == 0 else 0 for row in range(height)])
+    return mask
+
+
+# 'L' lookup table mapping any non-zero value to 255
+_NONZERO_LUT = [0] + [255] * 255
+
+# White 32x32 QR background; copied, never drawn on directly
+_QR_BLANK = Image.new('RGB', (32, 32), color=(255, 255, 255))
+
+
+def _truncate(text: str, length: int) -> str:
+    """Cut text to length characters, marking the cut with "..."."""
+    return text if len(text) <= length else text[:length] + "..."
+
+
+def _qr_modules_image(qr) -> Image.Image:
+    """Build a black-on-white image of qr at 1 pixel per module, border included.
+
+    Reads the module matrix directly rather than going through qr.make_image(),
+    which draws each module as a separate rectangle.
+    """
+    matrix = qr.get_matrix()
+    size = len(matrix)
+    data = bytes(0 if dark else 255 for row in matrix for dark in row)
+    return Image.frombytes('L', (size, size), data)
+
+
+@functools.lru_cache(maxsize=8)
+def _make_qr_image(url: str) -> Image.Image:
+    """Render the 32x32 QR code image for url (see MatrixDisplay.generate_qr_image).
+
+    Cached because QR encoding is slow on a Pi and the same short URL is
+    shown for the whole device code lifetime. Callers must not mutate the
+    returned image.
+    """
+    try:
+        # Try version 2 with 2-pixel border (25+4=29px) for better quiet zone
+        qr = qrcode.QRCode(
+            version=2,  # 25x25 modules
+            error_correction=qrcode.constants.ERROR_CORRECT_L,
+            box_size=1,  # 1 pixel per module
+            border=2,    # 2-pixel white border (quiet zone for scanning)
+        )
+        qr.add_data(url)
+        qr.make(fit=False)  # Don't auto-adjust, fail if URL too long
+
+        img = _qr_modules_image(qr)
+
+        # Version 2 + border 2 = 29x29, center in 32x32
+        padded = _QR_BLANK.copy()
+        padded.paste(img, (1, 1))  # Center with 1-2px padding
+        return padded
+
+    except Exception as version2_error:
+        # If version 2 too small, fall back to version 3 with smaller border
+        try:
+            qr = qrcode.QRCode(
+                version=3,  # 29x29 modules - fits longer URLs
+                error_correction=qrcode.constants.ERROR_CORRECT_L,
+                box_size=1,  # 1 pixel per module
+                border=1,    # 1-pixel white border (minimal quiet zone)
+            )
+            qr.add_data(url)
+            qr.make(fit=False)
+
+            img = _qr_modules_image(qr)
+
+            # Version 3 + border 1 = 31x31, center in 32x32
+            padded = _QR_BLANK.copy()
+            padded.paste(img, (0, 0))
+            return padded
+
+        except Exception as e:
+            logger.error("Failed to generate QR code: %s. URL may be too long (%d chars): %s",
+                         e, len(url), url)
+            # Return a blank 32x32 white image as fallback
+            return _QR_BLANK.copy()
 
 
 class PatrolScore:
     """Represents a patrol and its score."""
+    __slots__ = ("name", "score", "id")
+
     def __init__(self, name: str, score: int, patrol_id: str = ""):
         self.name = name
         self.score = score
@@ -176,8 +350,39 @@ class MatrixDisplay:
         # Crisp and readable on LED matrices with visible gaps between pixels.
         self.draw.fontmode = "1"
 
+        # Scratch mask for draw_composite_texts(), cleared and reused per call;
+        # its 1-bit drawer also measures ink for _render_text()
+        self._text_mask = Image.new('L', (cols, rows), 0)
+        self._text_mask_draw = ImageDraw.Draw(self._text_mask)
+        self._text_mask_draw.fontmode = "1"
+
         # Load fonts (BDF bitmap preferred, TrueType fallback)
-        self.font, self.small_font, self.large_font = _load_fonts()
+        self.font, self.small_font, self._load_large_font = _load_fonts()
+        # font_size name -> font, see _font(); "large" is added on first use
+        self._fonts = {"normal": self.font, "small": self.small_font}
+
+        # Inputs of the last show_scores() / show_countdown() frame; an
+        # identical call is skipped
+        self._scores_sig = None
+        self._countdown_sig = None
+        # Last patrol_colors dict passed in and its sorted items, see _colors_sig_of()
+        self._colors_sig_src: Optional[Dict[str, str]] = None
+        self._colors_sig: tuple = ()
+        # (id, name, score, color) drawn in each strip of that frame, or None if empty
+        self._strip_sigs: List[Optional[tuple]] = [None] * MAX_STRIPS
+        # A fixed-height bitmap small font no taller than a strip keeps each
+        # patrol's text inside its own strip, so strips can be repainted alone
+        self._strips_separable = (not hasattr(self.small_font, 'getmetrics')
+                                  and self.small_font.getbbox("A")[3] <= STRIP_HEIGHT)
+
+        # (name, score) -> laid out strip text, see _strip_text()
+        self._strip_text_cache: Dict[Tuple[str, int], Tuple[str, str, int]] = {}
+
+        # (text, font_size) -> rasterised text, see _render_text()
+        self._text_cache: Dict[Tuple[str, str], tuple] = {}
+
+        # Fully rendered static screens, keyed by what they display
+        self._screen_cache: Dict[tuple, Image.Image] = {}
 
         if not self.simulate:
             # Configure the matrix
@@ -194,22 +399,107 @@ class MatrixDisplay:
 
             self.matrix = RGBMatrix(options=options)
             self.canvas = self.matrix.CreateFrameCanvas()
+
+            # SwapOnVSync blocks until the next refresh, so frames are handed to
+            # a writer thread that owns the canvas. Only the newest frame is kept:
+            # if show() is called again before the writer picks a frame up, the
+            # stale one is dropped.
+            self._frame_cond = threading.Condition()
+            self._pending_frame: Optional[Image.Image] = None
+            # Pixels of the last queued frame; queuing an identical frame is skipped
+            self._shown_bytes: Optional[bytes] = None
+            self._writer_stop = False
+            self._writer = threading.Thread(target=self._write_loop, daemon=True, name="matrix-writer")
+            self._writer.start()
         else:
-            print(f"[DISPLAY] Simulation mode: {cols}x{rows} matrix")
+            logger.info("Simulation mode: %dx%d matrix", cols, rows)
             self.matrix = None
             self.canvas = None
 
+    @property
+    def large_font(self) -> ImageFont.ImageFont:
+        """Large font, loaded on first use."""
+        font = self._fonts.get("large")
+        if font is None:
+            font = self._fonts["large"] = self._load_large_font()
+        return font
+
+    def _font(self, font_size: str) -> ImageFont.ImageFont:
+        """Font for a font_size name; anything unrecognised falls back to small."""
+        font = self._fonts.get(font_size)
+        if font is None:
+            font = self.large_font if font_size == "large" else self.small_font
+        return font
+
     def clear(self):
         """Clear the frame buffer."""
         self.draw.rectangle([(0, 0), (self.cols - 1, self.rows - 1)], fill=(0, 0, 0))
+        self._scores_sig = None
+        self._countdown_sig = None
         if self.simulate:
-            print("[DISPLAY] Clear")
+            logger.debug("Clear")
+
+    def _restore_screen(self, key: tuple) -> bool:
+        """Copy a cached static screen into the frame buffer.
+
+        Returns:
+            True if the screen was cached, False if it must be rendered
+        """
+        cached = self._screen_cache.get(key)
+        if cached is None:
+            return False
+        self.frame.paste(cached)
+        return True
+
+    def _store_screen(self, key: tuple):
+        """Cache the current frame buffer as the rendered screen for key."""
+        if len(self._screen_cache) >= SCREEN_CACHE_SIZE:
+            # Evict the oldest entry (dicts keep insertion order)
+            del self._screen_cache[next(iter(self._screen_cache))]
+        self._screen_cache[key] = self.frame.copy()
+
+    def invalidate(self):
+        """Force the next show_scores() or show_countdown() call to redraw even if its inputs are unchanged."""
+        self._scores_sig = None
+        self._countdown_sig = None
 
     def show(self):
-        """Push the frame buffer to the LED matrix."""
+        """Queue the frame buffer for the LED matrix without waiting for VSync.
+
+        Nothing is queued if the frame is identical to the last one queued.
+        """
         if not self.simulate:
-            self.canvas.SetImage(self.frame)
+            data = self.frame.tobytes()
+            if data == self._shown_bytes:
+                return
+            self._shown_bytes = data
+            with self._frame_cond:
+                self._pending_frame = Image.frombytes('RGB', self.frame.size, data)
+                self._frame_cond.notify_all()
+
+    def _write_loop(self):
+        """Writer thread: push queued frames to the matrix until stopped.
+
+        Only the region that differs from what the drawing canvas already
+        holds is written. With double buffering that is the frame from two
+        swaps ago, not the one on display; None means unknown (write it all).
+        """
+        back_frame = front_frame = None
+        while True:
+            with self._frame_cond:
+                while self._pending_frame is None and not self._writer_stop:
+                    self._frame_cond.wait()
+                if self._pending_frame is None:
+                    return
+                frame, self._pending_frame = self._pending_frame, None
+            if back_frame is None:
+                self.canvas.SetImage(frame)
+            else:
+                bbox = ImageChops.difference(frame, back_frame).getbbox()
+                if bbox is not None:
+                    self.canvas.SetImage(frame.crop(bbox), bbox[0], bbox[1])
             self.canvas = self.matrix.SwapOnVSync(self.canvas)
+            back_frame, front_frame = front_frame, frame
 
     def draw_text(self, x: int, y: int, text: str,
                   color: Tuple[int, int, int] = (255, 255, 255),
@@ -223,25 +513,54 @@ class MatrixDisplay:
             color: RGB tuple (0-255 each)
             font_size: "normal", "small", or "large"
         """
-        if font_size == "large":
-            font = self.large_font
-        elif font_size == "normal":
-            font = self.font
-        else:
-            font = self.small_font
+        mask, dx, dy, _ = self._render_text(text, font_size)
+        if mask is not None:
+            left, top = x + dx, y + dy
+            self.frame.paste(color, (left, top, left + mask.width, top + mask.height), mask)
+
+        if self.simulate:
+            logger.debug("Text at (%d,%d): %r color=%s", x, y, text, color)
+
+    def _render_text(self, text: str, font_size: str) -> tuple:
+        """Rasterise text once and reuse it while it stays in the text cache.
+
+        Returns:
+            (mask, dx, dy, width): a 1-bit 'L' mask of the ink (None if there
+            is none), the offset of its top-left corner from the (x, baseline y)
+            draw position, and the text's advance width
+        """
+        key = (text, font_size)
+        rendered = self._text_cache.get(key)
+        if rendered is not None:
+            return rendered
+
+        font = self._font(font_size)
+        bbox = font.getbbox(text)
         # Convert baseline y to top-left y for PIL.
         # TrueType fonts have getmetrics(), BDF/PIL bitmap fonts do not.
         if hasattr(font, 'getmetrics'):
             ascent, descent = font.getmetrics()
-            top_y = y - ascent
+            top = -ascent
         else:
             # PIL bitmap font: getbbox gives us the bounding box
-            bbox = font.getbbox(text)
-            top_y = y - (bbox[3] - bbox[1])
-        self.draw.text((x, top_y), text, fill=color, font=font)
+            top = -(bbox[3] - bbox[1])
+
+        # Crop the mask to the ink as drawn in 1-bit mode
+        left, upper, right, lower = self._text_mask_draw.textbbox((0, top), text, font=font)
+        if right > left and lower > upper:
+            mask = Image.new('L', (right - left, lower - upper), 0)
+            mask_draw = ImageDraw.Draw(mask)
+            mask_draw.fontmode = "1"
+            mask_draw.text((-left, top - upper), text, fill=255, font=font)
+        else:
+            mask = None
 
-        if self.simulate:
-            print(f"[DISPLAY] Text at ({x},{y}): '{text}' color={color}")
+        rendered = (mask, left, upper, bbox[2] - bbox[0])
+        if len(self._text_cache) >= TEXT_CACHE_SIZE:
+            # Evict the oldest entry (dicts keep insertion order)
+            del self._text_cache[next(iter(self._text_cache))]
+        self._text_cache[key] = rendered
+        return rendered
 
     def text_width(self, text: str, font_size: str = "normal") -> int:
         """Get the pixel width of rendered text.
@@ -253,14 +572,7 @@ class MatrixDisplay:
         Returns:
             Width in pixels
         """
-        if font_size == "large":
-            font = self.large_font
-        elif font_size == "normal":
-            font = self.font
-        else:
-            font = self.small_font
-        bbox = font.getbbox(text)
-        return bbox[2] - bbox[0]
+        return self._render_text(text, font_size)[3]
 
     def draw_line(self, x1: int, y1: int, x2: int, y2: int,
                   color: Tuple[int, int, int] = (100, 100, 100)):
@@ -271,9 +583,13 @@ class MatrixDisplay:
             x2, y2: End coordinates
             color: RGB tuple
         """
-        self.draw.line([(x1, y1), (x2, y2)], fill=color)
+        if y1 == y2:
+            # Horizontal (the bar borders): a plain rectangle fill
+            self.frame.paste(color, (min(x1, x2), y1, max(x1, x2) + 1, y1 + 1))
+        else:
+            self.draw.line([(x1, y1), (x2, y2)], fill=color)
         if self.simulate:
-            print(f"[DISPLAY] Line from ({x1},{y1}) to ({x2},{y2})")
+            logger.debug("Line from (%d,%d) to (%d,%d)", x1, y1, x2, y2)
 
     def draw_status_indicator(self, rate_limit_state: str, ws_connected: bool = False):
         """Draw a status indicator pixel in the top-right corner.
@@ -284,20 +600,11 @@ class MatrixDisplay:
             ws_connected: True when the device has an active WebSocket connection
                           to the server (shows blue instead of green when state is NONE)
         """
-        # Status colors
-        colors = {
-            "LOADING": (128, 128, 128),           # Grey
-            "NONE": (0, 255, 0),                  # Green (polling only)
-            "DEGRADED": (255, 191, 0),            # Amber
-            "USER_TEMPORARY_BLOCK": (255, 0, 0),  # Red
-            "SERVICE_BLOCKED": (255, 0, 0),       # Red (but will show message)
-        }
-
-        color = colors.get(rate_limit_state, (128, 128, 128))  # Default to grey
-
         # Blue dot when WebSocket is open and all else is healthy
         if ws_connected and rate_limit_state == "NONE":
-            color = (0, 0, 255)
+            color = STATUS_WS_COLOR
+        else:
+            color = STATUS_COLORS.get(rate_limit_state, STATUS_DEFAULT_COLOR)
 
         # Draw 1x1 pixel in top-right corner
         x = self.cols - 2  # 2 pixels from right edge
@@ -305,8 +612,8 @@ class MatrixDisplay:
         self.frame.putpixel((x, y), color)
 
         if self.simulate:
-            ws_label = " [WS]" if ws_connected else ""
-            print(f"[DISPLAY] Status indicator: {rate_limit_state}{ws_label} at ({x},{y}) color={color}")
+            logger.debug("Status indicator: %s%s at (%d,%d) color=%s",
+                         rate_limit_state, " [WS]" if ws_connected else "", x, y, color)
 
     def generate_qr_image(self, url: str):
         """Generate a QR code image for the given URL.
@@ -319,50 +626,9 @@ class MatrixDisplay:
         """
         if not QR_AVAILABLE:
             # Return a blank 32x32 white image if QR library not available
-            return Image.new('RGB', (32, 32), color=(255, 255, 255))
-
-        try:
-            # Try version 2 with 2-pixel border (25+4=29px) for better quiet zone
-            qr = qrcode.QRCode(
-                version=2,  # 25x25 modules
-                error_correction=qrcode.constants.ERROR_CORRECT_L,
-                box_size=1,  # 1 pixel per module
-                border=2,    # 2-pixel white border (quiet zone for scanning)
-            )
-            qr.add_data(url)
-            qr.make(fit=False)  # Don't auto-adjust, fail if URL too long
-
-            img = qr.make_image(fill_color="black", back_color="white")
-
-            # Version 2 + border 2 = 29x29, center in 32x32
-            padded = Image.new('RGB', (32, 32), color=(255, 255, 255))
-            padded.paste(img, (1, 1))  # Center with 1-2px padding
-            return padded
-
-        except Exception as version2_error:
-            # If version 2 too small, fall back to version 3 with smaller border
-            try:
-                qr = qrcode.QRCode(
-                    version=3,  # 29x29 modules - fits longer URLs
-                    error_correction=qrcode.constants.ERROR_CORRECT_L,
-                    box_size=1,  # 1 pixel per module
-                    border=1,    # 1-pixel white border (minimal quiet zone)
-                )
-                qr.add_data(url)
-                qr.make(fit=False)
-
-                img = qr.make_image(fill_color="black", back_color="white")
-
-                # Version 3 + border 1 = 31x31, center in 32x32
-                padded = Image.new('RGB', (32, 32), color=(255, 255, 255))
-                padded.paste(img, (0, 0))
-                return padded
+            return _QR_BLANK.copy()
 
-            except Exception as e:
-                print(f"ERROR: Failed to generate QR code: {e}")
-                print(f"URL may be too long ({len(url)} chars): {url}")
-                # Return a blank 32x32 white image as fallback
-                return Image.new('RGB', (32, 32), color=(255, 255, 255))
+        return _make_qr_image(url).copy()
 
     def show_device_code(self, code: str, url: str, url_short: Optional[str] = None):
         """Display the device authorization code with QR code and text.
@@ -376,29 +642,28 @@ class MatrixDisplay:
 
         # Use QR code layout if available and url_short provided
         if QR_AVAILABLE and url_short and not self.simulate:
-            # Generate QR code and paste onto frame buffer
-            qr_img = self.generate_qr_image(url_short)
-            self.frame.paste(qr_img.convert('RGB'), (0, 0))
-
-            # Display wrapped device code on right side
-            # Code format: "MRHQ-TDY4" (9 chars total)
-            # Split into two lines to fit in 30px width
-            self.draw_text(34, 10, code[:4], color=(255, 255, 0))      # "MRHQ"
-            self.draw_text(34, 20, code[5:], color=(255, 255, 0))      # "TDY4" (skip hyphen)
+            # The layout only depends on the code and URL; reuse it if already rendered
+            key = ("device_code", code, url_short)
+            if not self._restore_screen(key):
+                # Generate QR code and paste onto frame buffer
+                # The cached image is already RGB and paste() only reads it,
+                # so no defensive copy or conversion is needed
+                self.frame.paste(_make_qr_image(url_short), (0, 0))
+
+                # Display wrapped device code on right side
+                # Code format: "MRHQ-TDY4" (9 chars total)
+                # Split at the hyphen into two lines to fit in 30px width
+                top, _, bottom = code.partition("-")
+                self.draw_text(34, 10, top, color=(255, 255, 0))      # "MRHQ"
+                self.draw_text(34, 20, bottom, color=(255, 255, 0))   # "TDY4"
+                self._store_screen(key)
 
             self.show()
 
         elif self.simulate and QR_AVAILABLE and url_short:
-            # Simulation mode with QR capability - print both
-            print(f"\n{'='*50}")
-            print(f"DEVICE AUTHORIZATION")
-            print(f"{'='*50}")
-            print(f"Scan QR code or visit: {url}")
-            print(f"Short link: {url_short}")
-            print(f"\nDevice Code: {code}")
-            print(f"  Line 1: {code[:4]}")
-            print(f"  Line 2: {code[5:]}")
-            print(f"{'='*50}\n")
+            # Simulation mode with QR capability - log the URLs and print an ASCII QR
+            logger.info("Device authorization: scan QR code or visit %s (short link %s), "
+                        "device code %s", url, url_short, code)
 
             # Generate ASCII QR for terminal display
             try:
@@ -407,7 +672,7 @@ class MatrixDisplay:
                 qr.make(fit=True)
                 qr.print_ascii(invert=True)
             except Exception as e:
-                print(f"Could not generate ASCII QR: {e}")
+                logger.warning("Could not generate ASCII QR: %s", e)
 
         else:
             # Fallback to text-only display (QR not available or no complete URL)
@@ -415,18 +680,13 @@ class MatrixDisplay:
             self.draw_text(4, 20, code, color=(255, 255, 0))
 
             # Draw URL hint (may be truncated)
-            url_display = url.replace("https://", "").replace("http://", "")
-            if len(url_display) > 12:
-                url_display = url_display[:12] + "..."
+            url_display = _truncate(url.removeprefix("https://").removeprefix("http://"), 12)
             self.draw_text(2, 30, url_display, color=(100, 100, 100))
 
             self.show()
 
             if self.simulate:
-                print(f"\n{'='*40}")
-                print(f"DEVICE CODE: {code}")
-                print(f"Visit: {url}")
-                print(f"{'='*40}\n")
+                logger.info("Device code: %s, visit %s", code, url)
 
     def show_waiting(self, message: str = "Waiting..."):
         """Display a waiting message.
@@ -435,11 +695,14 @@ class MatrixDisplay:
             message: Message to display
         """
         self.clear()
-        self.draw_text(2, 16, message, color=(255, 200, 0))
+        key = ("waiting", message)
+        if not self._restore_screen(key):
+            self.draw_text(2, 16, message, color=(255, 200, 0))
+            self._store_screen(key)
         self.show()
 
         if self.simulate:
-            print(f"[DISPLAY] {message}")
+            logger.info("Waiting: %s", message)
 
     def show_error(self, error: str):
         """Display an error message.
@@ -449,18 +712,20 @@ class MatrixDisplay:
         """
         self.clear()
 
-        # Draw "ERROR" in red
-        self.draw_text(2, 8, "ERROR:", color=(255, 0, 0))
-
         # Draw error message, truncated if needed
-        if len(error) > 11:
-            error = error[:11] + "..."
-        self.draw_text(2, 24, error, color=(255, 100, 100))
+        error = _truncate(error, 11)
+
+        key = ("error", error)
+        if not self._restore_screen(key):
+            # Draw "ERROR" in red
+            self.draw_text(2, 8, "ERROR:", color=(255, 0, 0))
+            self.draw_text(2, 24, error, color=(255, 100, 100))
+            self._store_screen(key)
 
         self.show()
 
         if self.simulate:
-            print(f"[DISPLAY ERROR] {error}")
+            logger.info("Error: %s", error)
 
     def draw_composite_text(self, x: int, y: int, text: str,
                             font_size: str = "small",
@@ -480,36 +745,42 @@ class MatrixDisplay:
             color_on_lit: RGB color where text overlaps a lit pixel
             color_on_dark: RGB color where text overlaps a dark pixel
         """
-        if font_size == "large":
-            font = self.large_font
-        elif font_size == "normal":
-            font = self.font
-        else:
-            font = self.small_font
+        self.draw_composite_texts([(x, y, text)], font_size, color_on_lit, color_on_dark)
 
-        # Compute top_y (same logic as draw_text)
-        if hasattr(font, 'getmetrics'):
-            ascent, _ = font.getmetrics()
-            top_y = y - ascent
-        else:
-            bbox = font.getbbox(text)
-            top_y = y - (bbox[3] - bbox[1])
-
-        # Render text to a grayscale mask at the same frame coordinates
-        text_mask = Image.new('L', (self.cols, self.rows), 0)
-        mask_draw = ImageDraw.Draw(text_mask)
-        mask_draw.fontmode = "1"
-        mask_draw.text((x, top_y), text, fill=255, font=font)
-
-        # Composite: check each text pixel against the existing frame
-        for py in range(max(0, top_y), min(self.rows, top_y + 16)):
-            for px in range(max(0, x), min(self.cols, x + self.text_width(text, font_size) + 2)):
-                if text_mask.getpixel((px, py)) > 0:
-                    r, g, b = self.frame.getpixel((px, py))
-                    if r > 0 or g > 0 or b > 0:
-                        self.frame.putpixel((px, py), color_on_lit)
-                    else:
-                        self.frame.putpixel((px, py), color_on_dark)
+    def draw_composite_texts(self, texts: List[Tuple[int, int, str]],
+                             font_size: str = "small",
+                             color_on_lit: Tuple[int, int, int] = TEXT_ON_BAR,
+                             color_on_dark: Tuple[int, int, int] = TEXT_ON_DARK):
+        """Draw several strings composited with existing frame content in one pass.
+
+        Same as draw_composite_text() for each (x, y, text), except that all
+        strings are rasterised into one mask and composited together, so
+        strings do not composite over each other.
+        """
+        text_mask = self._text_mask
+        text_mask.paste(0, (0, 0, self.cols, self.rows))
+
+        for x, y, text in texts:
+            # Stamp the text into the grayscale mask at the same frame coordinates
+            mask, dx, dy, _ = self._render_text(text, font_size)
+            if mask is not None:
+                left, top = x + dx, y + dy
+                text_mask.paste(255, (left, top, left + mask.width, top + mask.height), mask)
+
+        bbox = text_mask.getbbox()
+        if bbox is None:
+            return
+
+        # Composite over the text's bounding box with whole-image operations:
+        # split the text mask by whether the frame pixel under it is lit
+        # (any channel non-zero), then fill each part with its color.
+        text = text_mask.crop(bbox).point(_NONZERO_LUT)
+        r, g, b = self.frame.crop(bbox).split()
+        lit = ImageChops.lighter(ImageChops.lighter(r, g), b).point(_NONZERO_LUT)
+        on_lit = ImageChops.multiply(text, lit)
+        on_dark = ImageChops.subtract(text, lit)
+        self.frame.paste(color_on_lit, bbox, on_lit)
+        self.frame.paste(color_on_dark, bbox, on_dark)
 
     def draw_bar(self, x: int, y: int, width: int, height: int,
                  score: int, max_score: int, color: Tuple[int, int, int]):
@@ -527,21 +798,20 @@ class MatrixDisplay:
             height: Number of rows for the bar
             score: Number of LEDs to light
             max_score: Maximum LEDs (width * height), used for clamping
-            color: Base RGB tuple (will be scaled by BAR_BRIGHTNESS)
+            color: RGB tuple, already scaled for brightness (see BAR_RGB_SCALED)
         """
         num_leds = min(score, max_score)
         if num_leds <= 0:
             return
 
-        # Scale color by brightness
-        scaled = (int(color[0] * BAR_BRIGHTNESS),
-                  int(color[1] * BAR_BRIGHTNESS),
-                  int(color[2] * BAR_BRIGHTNESS))
-
-        for n in range(num_leds):
-            col = n // height
-            row = (height - 1) - (n % height)
-            self.frame.putpixel((x + col, y + row), scaled)
+        # Fill whole columns as one block, then the bottom of the partial column.
+        # Each paste is a single C-level fill rather than a putpixel per LED.
+        full_cols, partial = divmod(num_leds, height)
+        if full_cols:
+            self.frame.paste(color, (x, y, x + full_cols, y + height))
+        if partial:
+            self.frame.paste(color, (x + full_cols, y + height - partial,
+                                      x + full_cols + 1, y + height))
 
     def draw_zigzag(self, x: int, y: int, height: int,
                     color: Tuple[int, int, int] = (80, 80, 80)):
@@ -555,9 +825,38 @@ class MatrixDisplay:
             height: Number of rows
             color: RGB tuple for the zigzag pixels
         """
-        for row in range(height):
-            if row % 2 == 0:  # ON at rows 0, 2, 4
-                self.frame.putpixel((x, y + row), color)
+        self.frame.paste(color, (x, y, x + 1, y + height), _zigzag_mask(height))
+
+    def _strip_text(self, name: str, score: int) -> Tuple[str, str, int]:
+        """Lay out a patrol strip's text, reusing the result while it is unchanged.
+
+        Returns:
+            (truncated name, score text, score x coordinate)
+        """
+        key = (name, score)
+        layout = self._strip_text_cache.get(key)
+        if layout is None:
+            if len(self._strip_text_cache) >= STRIP_TEXT_CACHE_SIZE:
+                self._strip_text_cache.clear()
+            if len(name) > 11:  # Truncate long names (small font fits more)
+                name = name[:11]
+            score_text = str(score)
+            score_w = self.text_width(score_text, font_size="small")
+            score_x = self.cols - score_w - 2  # Extra padding from edge
+            layout = self._strip_text_cache[key] = (name, score_text, score_x)
+        return layout
+
+    def _colors_sig_of(self, patrol_colors: Dict[str, str]) -> tuple:
+        """Return patrol_colors as a sorted tuple of items, for frame signatures.
+
+        Cached responses hand over the same dict each time, so the tuple is
+        reused while the same dict is passed in. Callers must not modify a
+        dict after passing it.
+        """
+        if patrol_colors is not self._colors_sig_src:
+            self._colors_sig = tuple(sorted(patrol_colors.items()))
+            self._colors_sig_src = patrol_colors
+        return self._colors_sig
 
     def show_scores(self, patrols: List[PatrolScore], rate_limit_state: str = "NONE",
                     patrol_colors: Dict[str, str] = None, score_offset: int = 0,
@@ -570,27 +869,48 @@ class MatrixDisplay:
             patrol_colors: Dict mapping patrol ID to color name (e.g., {"123": "red"})
             score_offset: Score offset for broken-axis display (subtracted from scores)
             ws_connected: True when an active WebSocket connection is open (shows blue dot)
+
+        A call with the same inputs as the frame already on the display is a
+        no-op; any other screen, or invalidate(), resets this. When only some
+        patrols changed since the last scoreboard, only their strips are redrawn.
         """
         if patrol_colors is None:
             patrol_colors = {}
 
-        self.clear()
+        # Nothing to do if this exact scoreboard is already on the display
+        sig = (tuple((p.id, p.name, p.score) for p in patrols[:4]), rate_limit_state,
+               score_offset, self._colors_sig_of(patrol_colors), ws_connected)
+        prev_sig = self._scores_sig
+        if sig == prev_sig:
+            return
 
         # Special handling for service blocked - show message instead of scores
         if rate_limit_state == "SERVICE_BLOCKED":
-            self.draw_text(2, 10, "Service", color=(255, 0, 0))
-            self.draw_text(2, 20, "Blocked", color=(255, 0, 0))
-            self.draw_text(2, 28, "Contact", color=(255, 100, 0))
-            self.draw_text(2, 32, "Admin", color=(255, 100, 0))
-            self.draw_status_indicator(rate_limit_state, ws_connected=ws_connected)
+            self.clear()
+            # The whole screen is static (the indicator is red regardless of
+            # ws_connected), so render it once and reuse it
+            key = ("service_blocked",)
+            if not self._restore_screen(key):
+                self.draw_text(2, 10, "Service", color=(255, 0, 0))
+                self.draw_text(2, 20, "Blocked", color=(255, 0, 0))
+                self.draw_text(2, 28, "Contact", color=(255, 100, 0))
+                self.draw_text(2, 32, "Admin", color=(255, 100, 0))
+                self.draw_status_indicator(rate_limit_state, ws_connected=ws_connected)
+                self._store_screen(key)
             self.show()
+            self._scores_sig = sig
 
             if self.simulate:
-                print("\n" + "="*40)
-                print("SERVICE BLOCKED - Contact Administrator")
-                print("="*40 + "\n")
+                logger.info("Service blocked - contact administrator")
             return
 
+        # Repaint only changed strips if the frame already holds a scoreboard
+        # drawn with the same offset; otherwise start from a blank frame
+        if (prev_sig is None or prev_sig[1] == "SERVICE_BLOCKED"
+                or prev_sig[2] != score_offset or not self._strips_separable):
+            self.clear()
+            self._strip_sigs = [None] * MAX_STRIPS
+
         # Determine bar start column and max LEDs based on offset
         has_offset = score_offset > 0
         bar_start_col = 1 if has_offset else 0
@@ -598,74 +918,70 @@ class MatrixDisplay:
         bar_max = bar_cols * BAR_HEIGHT
 
         # Display up to 4 patrols
-        row_height = 8
-        for i, patrol in enumerate(patrols[:4]):
-            strip_y = i * row_height       # Top of this patrol's strip
-            border_top_y = strip_y + 1     # Top border line
-            bar_y = strip_y + 2            # Bar occupies rows 2-6 within the strip (5 rows)
-            border_bottom_y = strip_y + 7  # Bottom border line
-            text_y = strip_y + 8           # Baseline for text (1px below bottom border)
+        # Bind attributes used in the strip loop once
+        strip_sigs = self._strip_sigs
+        num_patrols = len(patrols)
+        cols = self.cols
+        draw_line = self.draw_line
+        draw_bar = self.draw_bar
+        draw_zigzag = self.draw_zigzag
+        strip_text = self._strip_text
+        fill = self.frame.paste
+        composite_texts = self.draw_composite_texts
+        for i, (border_top_y, bar_y, border_bottom_y, text_y) in enumerate(STRIP_ROWS):
+            patrol = patrols[i] if i < num_patrols else None
+            color_name = patrol_colors.get(patrol.id, DEFAULT_BAR_COLOR) if patrol else None
+            strip_sig = (patrol.id, patrol.name, patrol.score, color_name) if patrol else None
+            if strip_sig == strip_sigs[i]:
+                continue
+            if strip_sigs[i] is not None:
+                # Blank the strip's previous contents
+                strip_y = i * STRIP_HEIGHT
+                fill((0, 0, 0), (0, strip_y, cols, strip_y + STRIP_HEIGHT))
+            strip_sigs[i] = strip_sig
+            if patrol is None:
+                continue
 
             # Calculate display score (after offset)
             display_score = max(0, patrol.score - score_offset)
-            bar_length = int(math.ceil(float(display_score)/BAR_HEIGHT))
+            bar_length = -(-display_score // BAR_HEIGHT)  # ceil(display_score / BAR_HEIGHT)
 
-            # Look up theme palette
-            color_name = patrol_colors.get(patrol.id, DEFAULT_BAR_COLOR)
-            palette = THEME_PALETTES.get(color_name, THEME_PALETTES[DEFAULT_BAR_COLOR])
-
-            # Compute border color from bar base color at BORDER_BRIGHTNESS
-            bar_base = palette["bar"]
-            border_color = (int(bar_base[0] * BORDER_BRIGHTNESS),
-                            int(bar_base[1] * BORDER_BRIGHTNESS),
-                            int(bar_base[2] * BORDER_BRIGHTNESS))
+            # Look up the theme's pre-scaled border color
+            border_color = BORDER_RGB_SCALED.get(color_name, BORDER_RGB_SCALED[DEFAULT_BAR_COLOR])
 
             # Draw top and bottom border lines (matching bar length)
             if bar_length > 0:
                 border_end_x = bar_start_col + bar_length - 1
-                self.draw_line(bar_start_col, border_top_y, border_end_x, border_top_y, border_color)
+                draw_line(bar_start_col, border_top_y, border_end_x, border_top_y, border_color)
 
             # Draw zigzag broken-axis indicator if offset is active
             if has_offset:
-                self.draw_zigzag(0, bar_y, BAR_HEIGHT)
+                draw_zigzag(0, bar_y, BAR_HEIGHT)
 
             # Draw bar graph behind text
-            self.draw_bar(bar_start_col, bar_y, bar_cols, BAR_HEIGHT,
-                          display_score, bar_max, palette["bar"])
+            draw_bar(bar_start_col, bar_y, bar_cols, BAR_HEIGHT,
+                     display_score, bar_max,
+                     BAR_RGB_SCALED.get(color_name, BAR_RGB_SCALED[DEFAULT_BAR_COLOR]))
 
             if bar_length > 0:
                 border_end_x = bar_start_col + bar_length - 1
-                self.draw_line(bar_start_col, border_bottom_y, border_end_x, border_bottom_y, border_color)
+                draw_line(bar_start_col, border_bottom_y, border_end_x, border_bottom_y, border_color)
 
-            # Draw patrol name (left justified, composited over bar)
-            name = patrol.name
-            if len(name) > 11:  # Truncate long names (small font fits more)
-                name = name[:11]
-            self.draw_composite_text(1, text_y, name, font_size="small")
-
-            # Draw score (right justified, composited over bar)
-            score_text = str(patrol.score)
-            score_w = self.text_width(score_text, font_size="small")
-            score_x = self.cols - score_w - 2  # Extra padding from edge
-            self.draw_composite_text(score_x, text_y, score_text, font_size="small")
+            # Composite patrol name (left justified) and score (right justified)
+            # now, so text overhanging into the next strip is drawn over by it
+            name, score_text, score_x = strip_text(patrol.name, patrol.score)
+            composite_texts([(1, text_y, name), (score_x, text_y, score_text)], font_size="small")
 
         # Draw status indicator
         self.draw_status_indicator(rate_limit_state, ws_connected=ws_connected)
 
         self.show()
+        self._scores_sig = sig
 
-        if self.simulate:
-            print("\n" + "="*40)
-            print(f"SCOREBOARD (offset={score_offset})")
-            print("="*40)
-            for patrol in patrols[:4]:
-                display_score = max(0, patrol.score - score_offset)
-                color_name = patrol_colors.get(patrol.id, DEFAULT_BAR_COLOR)
-                print(f"{patrol.name:<15} {patrol.score:>6}  bar={display_score:>3} [{color_name}]")
-            print(f"\nStatus: {rate_limit_state}")
-            if has_offset:
-                print(f"Broken axis: offset={score_offset}")
-            print("="*40 + "\n")
+        if self.simulate and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Scoreboard (offset=%d, status=%s): %s", score_offset, rate_limit_state,
+                         ", ".join(f"{p.name}={p.score} [{patrol_colors.get(p.id, DEFAULT_BAR_COLOR)}]"
+                                   for p in patrols[:4]))
 
     def show_countdown(self, seconds_remaining: int, paused: bool = False,
                        patrols: List[PatrolScore] = None,
@@ -681,9 +997,10 @@ class MatrixDisplay:
             paused: If True, show timer in orange to indicate paused state
             patrols: Optional list of PatrolScore objects (up to 4)
             patrol_colors: Dict mapping patrol ID to color name
-        """
-        self.clear()
 
+        A call that would draw the same frame as the one already on the display
+        (same MM:SS, paused state and score strip) is a no-op.
+        """
         has_scores = bool(patrols)
 
         # Format as MM:SS
@@ -691,6 +1008,17 @@ class MatrixDisplay:
         seconds = max(0, seconds_remaining) % 60
         time_str = f"{minutes:02d}:{seconds:02d}"
 
+        # Nothing to do if this exact countdown is already on the display
+        if has_scores:
+            sig = (time_str, paused, tuple((p.id, p.name, p.score) for p in patrols[:4]),
+                   self._colors_sig_of(patrol_colors or {}))
+        else:
+            sig = (time_str, paused)
+        if sig == self._countdown_sig:
+            return
+
+        self.clear()
+
         # Center the time string horizontally; shift up when scores are shown
         text_w = self.text_width(time_str, font_size="large")
         x = max(0, (self.cols - text_w) // 2)
@@ -738,15 +1066,14 @@ class MatrixDisplay:
                 self.draw_text(score_x, y_score, score_text, color=SCORE_COLOR, font_size="small")
 
         self.show()
+        self._countdown_sig = sig
 
-        if self.simulate:
-            state = "PAUSED" if paused else "running"
-            print(f"[DISPLAY] Timer: {time_str} [{state}]")
+        if self.simulate and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Timer: %s [%s]", time_str, "PAUSED" if paused else "running")
             if has_scores:
-                print("[DISPLAY] Score strip:")
                 for i, patrol in enumerate((patrols or [])[:4]):
                     color_name = (patrol_colors or {}).get(patrol.id, DEFAULT_BAR_COLOR)
-                    print(f"  Q{i+1} ({color_name}): {patrol.name[:3]!r}  {patrol.score}")
+                    logger.debug("  Q%d (%s): %r  %d", i + 1, color_name, patrol.name[:3], patrol.score)
 
     def show_message(self, message: str, color: Tuple[int, int, int] = (255, 255, 255)):
         """Display a centered message.
@@ -756,17 +1083,25 @@ class MatrixDisplay:
             color: RGB color tuple
         """
         self.clear()
-        text_w = self.text_width(message)
-        x = max(0, (self.cols - text_w) // 2)
-        y = self.rows // 2
-        self.draw_text(x, y, message, color=color)
+        key = ("message", message, color)
+        if not self._restore_screen(key):
+            text_w = self.text_width(message)
+            x = max(0, (self.cols - text_w) // 2)
+            y = self.rows // 2
+            self.draw_text(x, y, message, color=color)
+            self._store_screen(key)
         self.show()
 
         if self.simulate:
-            print(f"[DISPLAY] {message}")
+            logger.info("Message: %s", message)
 
     def cleanup(self):
         """Clean up resources."""
         if not self.simulate and self.matrix:
             self.clear()
             self.show()
+            # The writer drains the final (blank) frame before exiting
+            with self._frame_cond:
+                self._writer_stop = True
+                self._frame_cond.notify_all()
+            self._writer.join(timeout=2)
@@ -6,17 +6,21 @@ Authenticates using OAuth device flow and polls for score updates.
 """
 
 import json
+import math
 import os
 import sys
+import tempfile
 import threading
 import time
 import signal
 import logging
+from datetime import datetime, timedelta, timezone
+from enum import IntEnum
 from pathlib import Path
 from typing import Optional, Callable, List
 
 from api_client import (
-    OSMDeviceClient, DeviceFlowError, AccessDenied, ExpiredToken,
+    OSMDeviceClient, DeviceFlowError, AccessDenied, ExpiredToken, NotAuthenticated,
     SectionNotFound, NotInTerm, UserTemporaryBlock, ServiceBlocked
 )
 from websocket_client import WebSocketClient
@@ -28,8 +32,19 @@ API_BASE_URL = os.getenv("API_BASE_URL", "http://localhost:8080")
 CLIENT_ID = os.getenv("CLIENT_ID", "scoreboard-rpi")
 POLL_INTERVAL = int(os.getenv("POLL_INTERVAL", "30"))  # Seconds between score updates
 TOKEN_FILE = Path(os.getenv("TOKEN_FILE", "/var/lib/scoreboard/token.txt"))
+SCORES_FILE = Path(os.getenv("SCORES_FILE", str(TOKEN_FILE.parent / "scores.json")))
+SCORES_FILE_MAX_AGE = 24 * 60 * 60  # Saved scores older than this aren't shown at startup
 SIMULATE_DISPLAY = os.getenv("SIMULATE_DISPLAY", "false").lower() == "true"
 
+# WebSocket endpoint derived from API_BASE_URL (http -> ws, https -> wss)
+WS_URL = (
+    API_BASE_URL
+    .replace("https://", "wss://")
+    .replace("http://", "ws://")
+    .rstrip("/")
+    + "/ws/device"
+)
+
 # Logging configuration
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 logging.basicConfig(
@@ -39,12 +54,41 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _write_file_atomic(path: Path, text: str):
+    """Replace path with text, so losing power mid-write can't leave it truncated.
+
+    The data is written to a private (0600) temporary file in the same
+    directory, synced, then renamed over path.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{path.name}-", dir=path.parent)
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+class TimerState(IntEnum):
+    """State of the countdown timer driven by WebSocket timer-* messages."""
+    INACTIVE = 0
+    RUNNING = 1
+    PAUSED = 2
+    FINISHED = 3
+
+
 class ScoreboardApp:
     """Main scoreboard application."""
 
     def __init__(self):
         """Initialize the scoreboard application."""
         self.display = MatrixDisplay(rows=32, cols=64, simulate=SIMULATE_DISPLAY)
+        # One client for the life of the process: polls and re-authentication
+        # share its session, so the HTTP connection is kept alive between them
         self.client = OSMDeviceClient(base_url=API_BASE_URL, client_id=CLIENT_ID)
         self.running = True
         self.authenticated = False
@@ -52,32 +96,77 @@ class ScoreboardApp:
         self.current_rate_limit_state = "NONE"  # Track current state
         self.score_offset = 0          # Bar graph offset for broken-axis display
         self.offset_initialized = False  # False until first successful score fetch
+        self._cached_token: Optional[str] = None  # Token as last read from / written to TOKEN_FILE
 
         # WebSocket state
         self._ws_client: Optional[WebSocketClient] = None
-        self._refresh_event = threading.Event()  # Set by WebSocket thread to wake main loop
+        self._refresh_event = threading.Event()  # Set by WebSocket thread to request a poll
+        self._ws_state_event = threading.Event()  # Set when the WS indicator needs a redraw
+        self._wake_event = threading.Event()  # Set alongside either of the above to wake main loop
 
         # Last-fetched patrol data — kept for display during timer countdown
         self._current_patrols: list = []
         self._current_patrol_colors: dict = {}
-
-        # Timer state
-        self._timer_state: str = 'inactive'  # 'inactive' | 'running' | 'paused' | 'finished'
+        # API patrol list _current_patrols was converted from; cached and
+        # revalidated responses share it, so they skip the conversion
+        self._current_patrols_source: Optional[list] = None
+        # (id, name, score) of each patrol in _current_patrols
+        self._current_patrols_sig: tuple = ()
+        # (patrols sig, colors, offset) last written to SCORES_FILE
+        self._saved_scores_sig: Optional[tuple] = None
+
+        # Timer state, driven by WebSocket messages and drawn by the main loop.
+        # While running, the timer reaches zero at _timer_deadline (monotonic);
+        # otherwise _timer_remaining holds the seconds left.
+        self._timer_state = TimerState.INACTIVE
         self._timer_remaining: int = 0
-        self._timer_tick = threading.Event()  # Signalled to interrupt timer sleeps
-        self._timer_thread: Optional[threading.Thread] = None
-
-        # Set up signal handler for SIGTERM (SIGINT/CTRL-C handled by KeyboardInterrupt)
+        self._timer_deadline: float = 0.0
+
+        # WebSocket message type -> handler; unknown types are ignored
+        self._ws_handlers = {
+            "refresh-scores": self._handle_refresh_scores,
+            "disconnect": self._handle_disconnect,
+            "timer-start": self._handle_timer_start,
+            "timer-pause": self._handle_timer_pause,
+            "timer-resume": self._handle_timer_resume,
+            "timer-reset": self._handle_timer_reset,
+        }
+
+        # Set up signal handler for SIGTERM and SIGINT (CTRL-C)
         signal.signal(signal.SIGTERM, self._signal_handler)
+        signal.signal(signal.SIGINT, self._signal_handler)
 
     def _signal_handler(self, signum, frame):
-        """Handle SIGTERM signal by raising KeyboardInterrupt for clean shutdown."""
+        """Handle SIGTERM/SIGINT by raising KeyboardInterrupt for clean shutdown.
+
+        Raising, rather than setting a flag, also interrupts an HTTP request or
+        device-flow wait the main thread is blocked in. Once shutdown has
+        started, further signals are ignored so they can't abort the cleanup.
+        """
+        if not self.running:
+            return
+        self.running = False
         logger.info(f"Received signal {signum}, shutting down...")
         raise KeyboardInterrupt()
 
     def _on_ws_state_change(self, connected: bool):
         """Called from WS thread when connection state changes."""
         self._ws_state_event.set()
+        self._wake_event.set()
+
+    def _request_refresh(self):
+        """Ask the main loop to poll for scores as soon as possible."""
+        self._refresh_event.set()
+        self._wake_event.set()
+
+    def _on_ws_error(self, error: Exception):
+        """Called from WS thread on connection errors."""
+        if getattr(error, "status_code", None) == 401:
+            # Token rejected: poll now rather than retrying the WebSocket with
+            # it; a 401 from the API marks us unauthenticated and stops the WS.
+            logger.warning("WebSocket: token rejected, re-checking authentication")
+            self.client.invalidate_cache()
+            self._request_refresh()
 
     def _start_websocket(self):
         """Start (or restart) the WebSocket client using the current access token."""
@@ -86,21 +175,15 @@ class ScoreboardApp:
         if not token:
             return
 
-        ws_url = (
-            API_BASE_URL
-            .replace("https://", "wss://")
-            .replace("http://", "ws://")
-            .rstrip("/")
-            + "/ws/device"
-        )
         headers = [f"Authorization: Bearer {token}"]
 
         logger.info("Starting WebSocket client")
         client = WebSocketClient(
-            ws_url,
+            WS_URL,
             on_message=self._on_ws_message,
             headers=headers,
             on_state_change=self._on_ws_state_change,
+            on_error=self._on_ws_error,
         )
         client.start()
         self._ws_client = client
@@ -112,6 +195,7 @@ class ScoreboardApp:
             self._ws_client.stop()
             self._ws_client = None
             self._ws_state_event.set()  # ensure UI can update immediately
+            self._wake_event.set()
 
     @property
     def _ws_connected(self) -> bool:
@@ -119,9 +203,8 @@ class ScoreboardApp:
 
     def _redraw_display_status_only(self):
         """Redraw using cached scores to update WS/rate-limit indicator without polling."""
-        if self._timer_state != 'inactive':
-            # Timer thread owns the display; let it redraw on next tick.
-            self._timer_tick.set()
+        if self._timer_state != TimerState.INACTIVE:
+            # The countdown owns the display; the main loop redraws it.
             return
 
         # If we have cached patrols, show them; otherwise keep current screen.
@@ -136,69 +219,69 @@ class ScoreboardApp:
 
     def _on_ws_message(self, data: dict):
         """Route incoming WebSocket messages to the appropriate handler."""
-        msg_type = data.get("type")
-        if msg_type == "refresh-scores":
-            logger.debug("WebSocket: received refresh-scores")
-            self._refresh_event.set()
-        elif msg_type == "disconnect":
-            logger.info(f"WebSocket: server requested disconnect ({data.get('reason', '')})")
-        elif msg_type == "timer-start":
-            duration = data.get("duration", 0)
-            logger.info(f"WebSocket: timer-start duration={duration}s")
-            self._start_timer(duration)
-        elif msg_type == "timer-pause":
-            logger.info("WebSocket: timer-pause")
-            self._timer_state = 'paused'
-            self._timer_tick.set()
-        elif msg_type == "timer-resume":
-            logger.info("WebSocket: timer-resume")
-            self._timer_state = 'running'
-            self._timer_tick.set()
-        elif msg_type == "timer-reset":
-            logger.info("WebSocket: timer-reset")
-            self._timer_state = 'inactive'
-            self._timer_tick.set()
-
-    def _start_timer(self, duration: int):
-        """Start a new countdown timer, stopping any existing one."""
-        # Stop existing timer thread
-        self._timer_state = 'inactive'
-        self._timer_tick.set()
-        if self._timer_thread is not None and self._timer_thread.is_alive():
-            self._timer_thread.join(timeout=2)
+        handler = self._ws_handlers.get(data.get("type"))
+        if handler is not None:
+            handler(data)
 
+    def _handle_refresh_scores(self, data: dict):
+        logger.debug("WebSocket: received refresh-scores")
+        self.client.invalidate_cache()
+        self._request_refresh()
+
+    def _handle_disconnect(self, data: dict):
+        logger.info(f"WebSocket: server requested disconnect ({data.get('reason', '')})")
+
+    def _handle_timer_start(self, data: dict):
+        duration = data.get("duration", 0)
+        logger.info(f"WebSocket: timer-start duration={duration}s")
         self._timer_remaining = duration
-        self._timer_tick.clear()
-        self._timer_state = 'running'
-        self._timer_thread = threading.Thread(target=self._timer_loop, daemon=True, name="timer")
-        self._timer_thread.start()
-
-    def _timer_loop(self):
-        """Daemon thread: decrement timer and update display each second."""
-        while self._timer_state != 'inactive':
-            if self._timer_state == 'running':
-                # Wait up to 1 second; shorter if signalled
-                signalled = self._timer_tick.wait(timeout=1.0)
-                self._timer_tick.clear()
-                if not signalled and self._timer_state == 'running':
-                    # One second elapsed, decrement
-                    self._timer_remaining -= 1
-                    if self._timer_remaining <= 0:
-                        self._timer_remaining = 0
-                        self._timer_state = 'finished'
+        self._timer_deadline = time.monotonic() + duration
+        self._timer_state = TimerState.RUNNING
+        self._wake_event.set()
+
+    def _handle_timer_pause(self, data: dict):
+        logger.info("WebSocket: timer-pause")
+        if self._timer_state == TimerState.RUNNING:
+            self._timer_remaining = max(0, math.ceil(self._timer_deadline - time.monotonic()))
+            self._timer_state = TimerState.PAUSED
+            self._wake_event.set()
+
+    def _handle_timer_resume(self, data: dict):
+        logger.info("WebSocket: timer-resume")
+        if self._timer_state == TimerState.PAUSED:
+            self._timer_deadline = time.monotonic() + self._timer_remaining
+            self._timer_state = TimerState.RUNNING
+            self._wake_event.set()
+
+    def _handle_timer_reset(self, data: dict):
+        logger.info("WebSocket: timer-reset")
+        self._timer_state = TimerState.INACTIVE
+        self._wake_event.set()
+
+    def _draw_countdown(self) -> Optional[float]:
+        """Draw the countdown as it stands now.
+
+        Returns:
+            Seconds until the displayed time next changes, or None if it is
+            paused or finished and only a WebSocket message can change it
+        """
+        wait = None
+        if self._timer_state == TimerState.RUNNING:
+            left = self._timer_deadline - time.monotonic()
+            if left > 0:
+                self._timer_remaining = math.ceil(left)
+                wait = left - (self._timer_remaining - 1)
             else:
-                # Paused or finished — wait for a signal
-                self._timer_tick.wait(timeout=0.5)
-                self._timer_tick.clear()
-
-            # Update display
-            paused = (self._timer_state == 'paused')
-            self.display.show_countdown(
-                self._timer_remaining,
-                paused=paused,
-                patrols=self._current_patrols,
-                patrol_colors=self._current_patrol_colors,
-            )
+                self._timer_remaining = 0
+                self._timer_state = TimerState.FINISHED
+
+        self.display.show_countdown(
+            self._timer_remaining,
+            paused=(self._timer_state == TimerState.PAUSED),
+            patrols=self._current_patrols,
+            patrol_colors=self._current_patrol_colors,
+        )
+        return wait
 
     def load_token(self) -> bool:
         """Load saved access token from file.
@@ -210,6 +293,7 @@ class ScoreboardApp:
             if TOKEN_FILE.exists():
                 token = TOKEN_FILE.read_text().strip()
                 if token:
+                    self._cached_token = token
                     self.client.set_access_token(token)
                     logger.info("Loaded saved access token")
                     return True
@@ -223,14 +307,72 @@ class ScoreboardApp:
         Args:
             token: Access token to save
         """
+        if token == self._cached_token:
+            logger.debug("Access token unchanged, not rewriting token file")
+            return
         try:
-            TOKEN_FILE.parent.mkdir(parents=True, exist_ok=True)
-            TOKEN_FILE.write_text(token)
-            TOKEN_FILE.chmod(0o600)  # Secure permissions
+            _write_file_atomic(TOKEN_FILE, token)
+            self._cached_token = token
             logger.info("Saved access token")
         except Exception as e:
             logger.error(f"Failed to save token: {e}")
 
+    def _save_scores(self):
+        """Save the current scores to SCORES_FILE if they changed since the last save."""
+        sig = (self._current_patrols_sig, tuple(sorted(self._current_patrol_colors.items())),
+               self.score_offset)
+        if sig == self._saved_scores_sig:
+            return
+        try:
+            _write_file_atomic(SCORES_FILE, json.dumps({
+                "saved_at": time.time(),
+                "patrols": self._current_patrols_sig,
+                "patrol_colors": self._current_patrol_colors,
+                "score_offset": self.score_offset,
+            }))
+            self._saved_scores_sig = sig
+        except Exception as e:
+            logger.warning(f"Failed to save scores: {e}")
+
+    def load_saved_scores(self) -> bool:
+        """Show the scores saved by a previous run, if they are recent enough.
+
+        The status indicator shows LOADING until the first poll. The saved
+        offset is only used for this preview; the first poll recalculates it.
+
+        Returns:
+            True if saved scores were shown
+        """
+        try:
+            data = json.loads(SCORES_FILE.read_text())
+            if time.time() - data["saved_at"] > SCORES_FILE_MAX_AGE:
+                return False
+            patrols_sig = tuple((pid, name, score) for pid, name, score in data["patrols"])
+            patrol_colors = data["patrol_colors"]
+            score_offset = data["score_offset"]
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            logger.warning(f"Failed to load saved scores: {e}")
+            return False
+        if not patrols_sig:
+            return False
+
+        self._current_patrols = [
+            DisplayPatrolScore(name, score, patrol_id) for patrol_id, name, score in patrols_sig
+        ]
+        self._current_patrols_sig = patrols_sig
+        self._current_patrol_colors = patrol_colors
+        self._saved_scores_sig = (patrols_sig, tuple(sorted(patrol_colors.items())), score_offset)
+        self.display.show_scores(
+            self._current_patrols,
+            "LOADING",
+            patrol_colors=patrol_colors,
+            score_offset=score_offset,
+        )
+        logger.info(f"Showing {len(patrols_sig)} saved patrol scores until the first poll")
+        return True
+
     def authenticate(self):
         """Perform device flow authentication."""
         logger.info("Starting device flow authentication...")
@@ -315,19 +457,32 @@ class ScoreboardApp:
                         self.score_offset = 0
                     self.offset_initialized = True
                 else:
-                    # Subsequent fetches: only recalculate if a score overflows
-                    if any(p.score - self.score_offset > 240 for p in response.patrols):
+                    # Subsequent fetches: only recalculate if a score overflows.
+                    # Some score overflows exactly when the highest one does.
+                    if max_score - self.score_offset > 240:
                         self.score_offset = max_score - 200
 
-            # Convert to display format
-            display_patrols = [
-                DisplayPatrolScore(name=p.name, score=p.score, patrol_id=p.id)
-                for p in response.patrols
-            ]
-
-            # Cache patrol data so the timer thread can overlay scores on the stopwatch
+            # Convert to display format, unless this is the list we already
+            # converted or a fresh fetch with the same patrols and scores
+            if response.patrols is self._current_patrols_source:
+                display_patrols = self._current_patrols
+            else:
+                patrols_sig = tuple((p.id, p.name, p.score) for p in response.patrols)
+                if patrols_sig == self._current_patrols_sig:
+                    display_patrols = self._current_patrols
+                else:
+                    # Built from the signature tuples, positionally
+                    display_patrols = [
+                        DisplayPatrolScore(name, score, patrol_id)
+                        for patrol_id, name, score in patrols_sig
+                    ]
+                    self._current_patrols_sig = patrols_sig
+                self._current_patrols_source = response.patrols
+
+            # Cache patrol data so the countdown can overlay scores on the stopwatch
             self._current_patrols = display_patrols
             self._current_patrol_colors = response.patrol_colors
+            self._save_scores()
 
             # Start WebSocket if server supports it and we don't have one yet
             if response.websocket_requested and self._ws_client is None:
@@ -343,6 +498,12 @@ class ScoreboardApp:
                     ws_connected=self._ws_connected,
                 )
 
+        except NotAuthenticated as e:
+            logger.warning(f"Authentication invalid, will re-authenticate: {e}")
+            self.display.show_error("Score Error")
+            self.authenticated = False
+            self._stop_websocket()
+
         except SectionNotFound as e:
             logger.error(f"Section not found: {e}")
             self.display.show_error("Section Lost")
@@ -354,8 +515,7 @@ class ScoreboardApp:
             logger.warning(f"Not in term: {e}")
             self.display.show_message("Between Terms", color=(255, 191, 0))
             # Retry after 24 hours as per API docs
-            from datetime import datetime, timedelta
-            self.cache_expires_at = datetime.now(tz=self.cache_expires_at.tzinfo if self.cache_expires_at else None) + timedelta(hours=24)
+            self.cache_expires_at = datetime.now(timezone.utc) + timedelta(hours=24)
 
         except UserTemporaryBlock as e:
             logger.warning(f"User temporarily blocked until {e.blocked_until}")
@@ -371,65 +531,83 @@ class ScoreboardApp:
             self.current_rate_limit_state = "SERVICE_BLOCKED"
             self.display.show_scores([], "SERVICE_BLOCKED")
             # Retry after a long time (1 hour)
-            from datetime import datetime, timedelta
-            self.cache_expires_at = datetime.now(tz=self.cache_expires_at.tzinfo if self.cache_expires_at else None) + timedelta(hours=1)
+            self.cache_expires_at = datetime.now(timezone.utc) + timedelta(hours=1)
 
         except DeviceFlowError as e:
             logger.error(f"Failed to get patrol scores: {e}")
             self.display.show_error("Score Error")
 
-            # If authentication error, mark as not authenticated
-            if "Authentication" in str(e) or "401" in str(e):
-                self.authenticated = False
-                self._stop_websocket()
-                logger.warning("Authentication appears invalid, will re-authenticate")
+    def _poll_deadline(self) -> Optional[float]:
+        """Return the time.monotonic() value at which to poll next, or None to poll now."""
+        if self.cache_expires_at is None:
+            return None
+        # Poll shortly after cache expires (add 7 seconds buffer as per API docs)
+        poll_time = self.cache_expires_at.replace(microsecond=0)
+        return time.monotonic() + (poll_time - datetime.now(timezone.utc)).total_seconds() + 7
 
     def run(self):
         """Main application loop."""
-        from datetime import datetime, timezone
-
         logger.info("Scoreboard application starting...")
         logger.info(f"API: {API_BASE_URL}")
         logger.info(f"Client ID: {CLIENT_ID}")
         logger.info(f"Default poll interval: {POLL_INTERVAL}s (will use cache_expires_at when available)")
 
         try:
-            # Show startup message
-            self.display.show_message("Starting...")
-            time.sleep(1)
+            # Show the scores saved by the last run until the first poll
+            # replaces them; otherwise a startup message
+            if not self.load_saved_scores():
+                self.display.show_message("Starting...")
+                time.sleep(1)
 
             # Try to load saved token
             if self.load_token():
-                # Verify token works by trying to get scores
-                try:
-                    self.update_scores()
-                    self.authenticated = True
+                # Verify token works by trying to get scores. update_scores()
+                # handles its own errors and clears the flag if it's rejected.
+                self.authenticated = True
+                self.update_scores()
+                if self.authenticated:
                     logger.info("Saved token is valid")
-                except DeviceFlowError:
+                else:
                     logger.warning("Saved token is invalid, will re-authenticate")
-                    self.authenticated = False
 
             # Authenticate if needed
             if not self.authenticated:
                 self.authenticate()
 
-            # Main loop: intelligently poll based on cache expiry
+            # Main loop: intelligently poll based on cache expiry. The deadline
+            # is only recomputed when a poll may have moved cache_expires_at.
+            poll_deadline = self._poll_deadline()
+            countdown_shown = False
             while self.running:
                 # Re-authenticate if needed (stop WebSocket first — token is stale)
                 if not self.authenticated:
                     self._stop_websocket()
                     self.authenticate()
 
-                # While timer is active, let the timer thread drive the display.
-                if self._timer_state != 'inactive':
-                    triggered = self._refresh_event.wait(timeout=0.1)
-                    self._refresh_event.clear()
-                    if triggered:
+                # Redraw the WS indicator if the connection state changed
+                if self._ws_state_event.is_set():
+                    self._ws_state_event.clear()
+                    self._redraw_display_status_only()
+
+                # While timer is active, the countdown owns the display. Scores
+                # are only refreshed on request, without redrawing.
+                if self._timer_state != TimerState.INACTIVE:
+                    countdown_shown = True
+                    if self._refresh_event.is_set():
+                        self._refresh_event.clear()
                         self.update_scores(update_display=False)
+                        poll_deadline = self._poll_deadline()
+                    timeout = self._draw_countdown()
+                    self._wake_event.wait(timeout=timeout)
+                    self._wake_event.clear()
                     continue
 
+                # Timer was reset: put the scoreboard back
+                if countdown_shown:
+                    countdown_shown = False
+                    self._redraw_display_status_only()
+
                 # Determine when to poll next
-                now = datetime.now(timezone.utc)
                 should_poll = False
 
                 if self._refresh_event.is_set():
@@ -437,24 +615,26 @@ class ScoreboardApp:
                     self._refresh_event.clear()
                     should_poll = True
                     logger.info("WebSocket triggered immediate score refresh")
-                elif self.cache_expires_at is None:
-                    # First poll or no cache info - poll immediately
+                elif poll_deadline is None or time.monotonic() >= poll_deadline:
+                    # First poll, no cache info, or cache expired - poll now
                     should_poll = True
-                else:
-                    # Poll shortly after cache expires (add 7 seconds buffer as per API docs)
-                    poll_time = self.cache_expires_at.replace(microsecond=0)
-                    time_until_poll = (poll_time - now).total_seconds() + 7
-
-                    if time_until_poll <= 0:
-                        should_poll = True
-                    else:
-                        logger.debug(f"Next poll in {time_until_poll:.0f}s (cache expires at {self.cache_expires_at})")
 
                 if should_poll:
                     self.update_scores()
+                    poll_deadline = self._poll_deadline()
 
-                # Sleep up to 1s; wake early if WebSocket signals a refresh
-                self._refresh_event.wait(timeout=1)
+                # Sleep until the next poll is due, waking early for WebSocket
+                # events. Wait at least 1s after a poll so failures don't spin.
+                if poll_deadline is None:
+                    timeout = 1.0
+                else:
+                    timeout = poll_deadline - time.monotonic()
+                    if should_poll:
+                        timeout = max(timeout, 1.0)
+                    logger.debug("Next poll in %.0fs (cache expires at %s)", timeout, self.cache_expires_at)
+                if timeout > 0:
+                    self._wake_event.wait(timeout=timeout)
+                    self._wake_event.clear()
 
         except KeyboardInterrupt:
             logger.info("Interrupted by user")
@@ -463,8 +643,10 @@ class ScoreboardApp:
             self.display.show_error("Fatal Error")
             time.sleep(5)
         finally:
+            self.running = False  # from here on, signals no longer interrupt
             logger.info("Cleaning up...")
             self._stop_websocket()
+            OSMDeviceClient.close_all()
             self.display.cleanup()
             logger.info("Scoreboard application stopped")
 
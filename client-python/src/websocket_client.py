@@ -1,115 +1,181 @@
-import json
-import logging
-import threading
-from typing import Optional, Callable, List
-
-logger = logging.getLogger(__name__)
-
-class WebSocketClient:
-    """Persistent WebSocket connection to the server for real-time score notifications.
-
-    Runs in a daemon thread and reconnects automatically with exponential backoff.
-    Calls on_message(data) for every parsed JSON message received.
-    """
-
-    def __init__(self, ws_url: str, on_message, headers: Optional[List[str]] = None,
-                 on_state_change: Optional[Callable[[bool], None]] = None):
-        self.url = ws_url
-        self.headers = headers or []
-        self._on_message = on_message
-        self._on_state_change = on_state_change
-        self._stop = threading.Event()
-        self._connected = False
-        self._app = None  # websocket.WebSocketApp instance
-        self._thread = threading.Thread(target=self._run_loop, daemon=True, name="ws-client")
-
-    def start(self):
-        """Start the background connection thread."""
-        self._thread.start()
-
-    def stop(self):
-        """Signal the connection thread to exit and close any open connection."""
-        self._stop.set()
-        if self._app is not None:
-            self._app.close()
-
-    @property
-    def connected(self) -> bool:
-        return self._connected
-
-    def _set_connected(self, value: bool):
-        if self._connected != value:
-            self._connected = value
-            if self._on_state_change is not None:
-                try:
-                    self._on_state_change(value)
-                except Exception as e:
-                    logger.debug(f"WebSocket state-change callback error: {e}")
-
-    def _run_loop(self):
-        import random
-
-        base_backoff = 2  # seconds before first retry
-        backoff = base_backoff
-
-        while not self._stop.is_set():
-            try:
-                self._connect()
-            except Exception as e:
-                logger.debug(f"WebSocket run error: {e}")
-
-            if self._stop.is_set():
-                break
-
-            # If we were connected at any point during the last attempt,
-            # treat it as "success" and reset backoff so brief drops recover quickly.
-            if self._connected:
-                backoff = base_backoff
-            else:
-                backoff = min(backoff * 2, 60)
-
-            # Add jitter to avoid thundering herd reconnects
-            sleep_for = backoff + random.uniform(0, min(1.0, backoff * 0.1))
-            logger.debug(f"WebSocket reconnecting in {sleep_for:.1f}s")
-            self._stop.wait(timeout=sleep_for)
-
-    def _connect(self):
-        try:
-            import websocket as ws_lib
-        except ImportError:
-            logger.warning("websocket-client not installed; real-time updates unavailable")
-            self._stop.set()
-            return
-
-        def on_open(ws):
-            self._set_connected(True)
-            logger.info("WebSocket connected — real-time score updates active")
-
-        def on_message(ws, message):
-            try:
-                data = json.loads(message)
-                self._on_message(data)
-            except Exception as e:
-                logger.warning(f"WebSocket message error: {e}")
-
-        def on_close(ws, close_status_code, close_msg):
-            self._set_connected(False)
-            logger.debug(f"WebSocket connection closed (code={close_status_code}, msg={close_msg})")
-
-        def on_error(ws, error):
-            self._set_connected(False)
-            logger.debug(f"WebSocket error: {error}")
-
-        self._app = ws_lib.WebSocketApp(
-            self.url,
-            header=self.headers,
-            on_open=on_open,
-            on_message=on_message,
-            on_close=on_close,
-            on_error=on_error,
-        )
-
-        # run_forever blocks until the connection closes
-        self._app.run_forever(ping_interval=30, ping_timeout=10)
-        self._set_connected(False)
-        self._app = None
+import json
+import logging
+import os
+import random
+import ssl
+import threading
+import time
+from typing import Optional, Callable, List
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    import websocket as ws_lib
+    WEBSOCKET_AVAILABLE = True
+except ImportError:
+    WEBSOCKET_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+RECONNECT_BASE_BACKOFF = 1    # shortest wait between retries, in seconds
+RECONNECT_MAX_BACKOFF = 30    # cap on the backoff
+RECONNECT_STABLE_AFTER = 30   # seconds a connection must stay open to reset the backoff
+
+# TLS client context shared by every WebSocketClient (see _shared_ssl_context)
+_SSL_CONTEXT: Optional[ssl.SSLContext] = None
+_SSL_CONTEXT_LOCK = threading.Lock()
+
+
+def _shared_ssl_context() -> ssl.SSLContext:
+    """Return the shared TLS client context, creating it on first use.
+
+    Without a context websocket-client builds one, and loads the CA bundle,
+    on every connection attempt. This honours the same
+    WEBSOCKET_CLIENT_CA_BUNDLE override that websocket-client does.
+    """
+    global _SSL_CONTEXT
+    with _SSL_CONTEXT_LOCK:
+        if _SSL_CONTEXT is None:
+            ca_bundle = os.environ.get("WEBSOCKET_CLIENT_CA_BUNDLE")
+            if ca_bundle and os.path.isfile(ca_bundle):
+                _SSL_CONTEXT = ssl.create_default_context(cafile=ca_bundle)
+            elif ca_bundle and os.path.isdir(ca_bundle):
+                _SSL_CONTEXT = ssl.create_default_context(capath=ca_bundle)
+            else:
+                _SSL_CONTEXT = ssl.create_default_context()
+        return _SSL_CONTEXT
+
+
+class WebSocketClient:
+    """Persistent WebSocket connection to the server for real-time score notifications.
+
+    Runs in a daemon thread and reconnects automatically with exponential backoff.
+    Calls on_message(data) for every parsed JSON message received, and
+    on_error(exc) for connection errors so the caller can react to, for
+    example, a rejected token instead of waiting out the retries.
+    """
+
+    def __init__(self, ws_url: str, on_message, headers: Optional[List[str]] = None,
+                 on_state_change: Optional[Callable[[bool], None]] = None,
+                 on_error: Optional[Callable[[Exception], None]] = None,
+                 ssl_context: Optional[ssl.SSLContext] = None):
+        self.url = ws_url
+        if ssl_context is None and ws_url.startswith("wss://"):
+            ssl_context = _shared_ssl_context()
+        self._sslopt = {"context": ssl_context} if ssl_context is not None else None
+        self.headers = headers or []
+        self._on_message = on_message
+        self._on_state_change = on_state_change
+        self._on_error = on_error
+        self._stop = threading.Event()
+        self._connected = False
+        self._opened_at: Optional[float] = None  # Monotonic time of on_open in the current attempt
+        self._app = None  # websocket.WebSocketApp instance
+        self._thread = threading.Thread(target=self._run_loop, daemon=True, name="ws-client")
+
+    def start(self):
+        """Start the background connection thread."""
+        self._thread.start()
+
+    def stop(self):
+        """Signal the connection thread to exit and close any open connection."""
+        self._stop.set()
+        if self._app is not None:
+            self._app.close()
+
+    @property
+    def connected(self) -> bool:
+        return self._connected
+
+    def _set_connected(self, value: bool):
+        if self._connected != value:
+            self._connected = value
+            if self._on_state_change is not None:
+                try:
+                    self._on_state_change(value)
+                except Exception as e:
+                    logger.debug("WebSocket state-change callback error: %s", e)
+
+    def _report_error(self, error: Exception):
+        if self._on_error is not None:
+            try:
+                self._on_error(error)
+            except Exception as e:
+                logger.debug("WebSocket error callback error: %s", e)
+
+    def _run_loop(self):
+        sleep_for = RECONNECT_BASE_BACKOFF
+
+        while not self._stop.is_set():
+            self._opened_at = None
+            try:
+                self._connect()
+            except Exception as e:
+                logger.debug("WebSocket run error: %s", e)
+                self._report_error(e)
+
+            if self._stop.is_set():
+                break
+
+            # If the last connection stayed open for a while, treat it as a
+            # success and reset backoff so brief drops recover quickly. One
+            # that is accepted then dropped straight away keeps backing off,
+            # so a flapping server doesn't get a reconnect every second.
+            if (self._opened_at is not None
+                    and time.monotonic() - self._opened_at >= RECONNECT_STABLE_AFTER):
+                sleep_for = RECONNECT_BASE_BACKOFF
+
+            # Decorrelated jitter: each wait is drawn from the whole range up to
+            # three times the previous one, so scoreboards dropped by the same
+            # server restart spread their reconnects out instead of clustering
+            sleep_for = min(RECONNECT_MAX_BACKOFF,
+                            random.uniform(RECONNECT_BASE_BACKOFF, sleep_for * 3))
+            logger.debug("WebSocket reconnecting in %.1fs", sleep_for)
+            self._stop.wait(timeout=sleep_for)
+
+    def _connect(self):
+        if not WEBSOCKET_AVAILABLE:
+            logger.warning("websocket-client not installed; real-time updates unavailable")
+            self._stop.set()
+            return
+
+        # One app serves every reconnect; run_forever() opens a fresh socket
+        # each time it is called.
+        if self._app is None:
+            self._app = ws_lib.WebSocketApp(
+                self.url,
+                header=self.headers,
+                on_open=self._ws_on_open,
+                on_message=self._ws_on_message,
+                on_close=self._ws_on_close,
+                on_error=self._ws_on_error,
+            )
+
+        # run_forever blocks until the connection closes
+        self._app.run_forever(sslopt=self._sslopt, ping_interval=30, ping_timeout=10)
+        self._set_connected(False)
+
+    def _ws_on_open(self, ws):
+        self._opened_at = time.monotonic()
+        self._set_connected(True)
+        logger.info("WebSocket connected — real-time score updates active")
+
+    def _ws_on_message(self, ws, message):
+        try:
+            data = _json_loads(message)
+            self._on_message(data)
+        except Exception as e:
+            logger.warning(f"WebSocket message error: {e}")
+
+    def _ws_on_close(self, ws, close_status_code, close_msg):
+        self._set_connected(False)
+        logger.debug("WebSocket connection closed (code=%s, msg=%s)", close_status_code, close_msg)
+
+    def _ws_on_error(self, ws, error):
+        self._set_connected(False)
+        logger.debug("WebSocket error: %s", error)
+        self._report_error(error)
@@ -0,0 +1,108 @@
+"""A saved token rejected with 401 must send the scoreboard back through the device flow.
+
+Runs against a local stub of the API in simulation mode:
+
+    python -m unittest discover -s tests
+"""
+import json
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+_TMP = tempfile.TemporaryDirectory()
+os.environ["SIMULATE_DISPLAY"] = "true"
+os.environ["TOKEN_FILE"] = str(Path(_TMP.name) / "token.txt")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+import scoreboard  # noqa: E402
+
+
+class _StubAPI(BaseHTTPRequestHandler):
+    """Rejects every token except the one issued by the device flow."""
+
+    new_token = "new-token"
+    requests = []
+    scores_served = threading.Event()
+
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self, status, body):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        self.requests.append(("GET", self.path))
+        if self.headers.get("Authorization") != f"Bearer {self.new_token}":
+            self._reply(401, {"error": "invalid_token"})
+            return
+        now = datetime.now(timezone.utc)
+        self._reply(200, {
+            "patrols": [{"id": "1", "name": "Eagles", "score": 10}],
+            "cached_at": now.isoformat(),
+            "cache_expires_at": (now + timedelta(minutes=5)).isoformat(),
+            "rate_limit_state": "NONE",
+        })
+        self.scores_served.set()
+
+    def do_POST(self):
+        self.requests.append(("POST", self.path))
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if self.path == "/device/authorize":
+            self._reply(200, {
+                "device_code": "dev",
+                "user_code": "ABCD-EFGH",
+                "verification_uri": "http://example/device",
+                "verification_uri_complete": "http://example/device?code=ABCD-EFGH",
+                "verification_uri_short": "example/d",
+                "expires_in": 60,
+                "interval": 0,
+            })
+        elif self.path == "/device/token":
+            self._reply(200, {"access_token": self.new_token, "token_type": "Bearer", "expires_in": 3600})
+        else:
+            self._reply(404, {"error": "not_found"})
+
+
+class ReauthenticateTest(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _StubAPI)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        scoreboard.API_BASE_URL = f"http://127.0.0.1:{self.server.server_port}"
+        Path(os.environ["TOKEN_FILE"]).write_text("stale-token")
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_rejected_saved_token_restarts_device_flow(self):
+        app = scoreboard.ScoreboardApp()
+        runner = threading.Thread(target=app.run, daemon=True)
+        runner.start()
+        try:
+            self.assertTrue(_StubAPI.scores_served.wait(timeout=30), _StubAPI.requests)
+        finally:
+            app.running = False
+            app._wake_event.set()
+            runner.join(timeout=10)
+
+        self.assertEqual(_StubAPI.requests[:3], [
+            ("GET", "/api/v1/patrols"),
+            ("POST", "/device/authorize"),
+            ("POST", "/device/token"),
+        ])
+        self.assertTrue(app.authenticated)
+        self.assertEqual(Path(os.environ["TOKEN_FILE"]).read_text(), _StubAPI.new_token)
+
+
+if __name__ == "__main__":
+    unittest.main()